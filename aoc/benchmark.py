@@ -0,0 +1,189 @@
+import logging
+import argparse
+import json
+import os
+import statistics
+import tempfile
+import time
+import tracemalloc
+
+from aoc import counters
+from aoc.days import DAYS, get_expected, get_input_file, get_parts, get_test_file, make_args, read_input, solve
+from aoc.generators import GENERATORS, generate
+from aoc.runner import configure_logging
+
+
+def time_part(day: str, part: int, input_file: str, test: bool, repeats: int, warmup: int) -> dict:
+    input_data = read_input(day, part, input_file)
+    args = make_args(day, part, test=test)
+
+    def call():
+        # hand each call its own copy so no run sees another run's leftovers
+        data = list(input_data) if isinstance(input_data, list) else input_data
+        return solve(day, part, data, args)
+
+    for _ in range(warmup): call()
+    timings = []
+    answer = None
+    for _ in range(repeats):
+        start = time.perf_counter()
+        answer = call()
+        timings.append(time.perf_counter() - start)
+
+    # tracemalloc slows everything down, so peak memory gets its own run,
+    # which is also where the work counters come from
+    counters.reset()
+    tracemalloc.start()
+    call()
+    (_, peak) = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    work = counters.snapshot()
+
+    expected = get_expected(day, part, input_file)
+    timings.sort()
+    return {
+        'day': day, 'part': part,
+        'input': None if input_file is None else os.path.basename(input_file),
+        'answer': answer, 'expected': expected,
+        'correct': None if expected is None else answer == expected,
+        'min': timings[0],
+        'median': statistics.median(timings),
+        'p95': timings[0] if len(timings) == 1 else statistics.quantiles(timings, n=20)[-1],
+        'peak_kb': peak / 1024,
+        'counters': work,
+    }
+
+
+def benchmark_key(result: dict) -> str:
+    return f"{result['day']}/{result['input']}/{result['part']}"
+
+
+def build_cases(days: list[str], parts: list[int], with_tests: bool) -> list[tuple[str, int, str, bool]]:
+    cases = []
+    for day in days:
+        for part in get_parts(day):
+            if part not in parts: continue
+            if DAYS[day]['input'] in ['none', 'value']:
+                cases.append((day, part, None, False))
+                continue
+            cases.append((day, part, get_input_file(day, part), False))
+            test_file = get_test_file(day, part)
+            if with_tests and test_file is not None:
+                cases.append((day, part, test_file, True))
+    return cases
+
+
+def run_benchmarks(cases, repeats: int, warmup: int, quiet: bool = True) -> list[dict]:
+    results = []
+    for (day, part, input_file, test) in cases:
+        # the solvers log their answers as they go; keep that out of the report
+        if quiet: logging.disable(logging.INFO)
+        try:
+            result = time_part(day, part, input_file, test, repeats, warmup)
+        finally:
+            logging.disable(logging.NOTSET)
+        results.append(result)
+        logging.info(format_result(result))
+    return results
+
+
+def run_sweep(days: list[str], parts: list[int], sizes: list[int], seed: int, repeats: int, warmup: int, quiet: bool = True) -> list[dict]:
+    # the same solver against generated inputs of growing size, to show how it scales
+    results = []
+    with tempfile.TemporaryDirectory() as temp_dir:
+        for day in days:
+            for size in sizes:
+                input_file = os.path.join(temp_dir, f"{day}_{size}.txt")
+                generate(day, size, seed, input_file)
+                cases = [(day, part, input_file, False) for part in get_parts(day) if part in parts]
+                for result in run_benchmarks(cases, repeats, warmup, quiet):
+                    result['size'] = size
+                    results.append(result)
+    return results
+
+
+# slowdowns smaller than this are timer noise, however big they look as a percentage
+MIN_CHANGE = 0.001
+
+
+def find_regressions(results: list[dict], baseline: dict, threshold: float, min_change: float = MIN_CHANGE) -> list[str]:
+    regressions = []
+    for result in results:
+        previous = baseline.get(benchmark_key(result))
+        if previous is None: continue
+        # best runs, which a busy machine disturbs much less than the median
+        slower = result['min'] - previous['min']
+        # it also has to be more than the baseline's own run-to-run spread
+        noise = max(min_change, previous['p95'] - previous['min'])
+        if slower > previous['min'] * threshold and slower > noise:
+            change = result['min'] / previous['min'] - 1
+            regressions.append(f"{benchmark_key(result)}: min {previous['min']:.4f}s -> {result['min']:.4f}s (+{change:.0%})")
+        if previous.get('answer') != result['answer']:
+            regressions.append(f"{benchmark_key(result)}: answer changed {previous.get('answer')} -> {result['answer']}")
+    return regressions
+
+
+def load_baseline(filename: str) -> dict:
+    if filename is None or not os.path.exists(filename): return {}
+    with open(filename) as baseline_file:
+        return json.load(baseline_file)
+
+
+def save_baseline(filename: str, results: list[dict]) -> None:
+    # keep the entries for anything that wasn't benchmarked this time
+    baseline = load_baseline(filename)
+    baseline.update({ benchmark_key(result): result for result in results })
+    with open(filename, 'w') as baseline_file:
+        json.dump(baseline, baseline_file, indent=2, default=str)
+
+
+def format_result(result: dict) -> str:
+    check = ''
+    if result['correct'] is not None:
+        check = ' ok' if result['correct'] else f" WRONG (expected {result['expected']})"
+    return (f"{result['day']} part {result['part']} [{result['input']}]: {result['answer']}{check}"
+        f" | min {result['min']:.4f}s median {result['median']:.4f}s p95 {result['p95']:.4f}s"
+        f" | peak {result['peak_kb']:.0f} KB"
+        + ''.join(f" | {name} {value}" for name, value in sorted(result['counters'].items())))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('-d', '--days', nargs='+', default=None)
+    parser.add_argument('-p', '--parts', type=int, nargs='+', default=[1, 2])
+    parser.add_argument('-n', '--repeats', type=int, default=5)
+    parser.add_argument('-w', '--warmup', type=int, default=1)
+    parser.add_argument('-b', '--baseline', default='benchmark_baseline.json')
+    parser.add_argument('-s', '--save-baseline', default=False, action='store_true')
+    parser.add_argument('-t', '--threshold', type=float, default=0.10)
+    parser.add_argument('--min-change', type=float, default=MIN_CHANGE)
+    parser.add_argument('--no-tests', default=False, action='store_true')
+    parser.add_argument('--sizes', type=int, nargs='+', default=None)
+    parser.add_argument('--seed', type=int, default=2015)
+    parser.add_argument('-o', '--output-file', default=None)
+    parser.add_argument('-v', '--verbose', default=False, action='store_true')
+    args = parser.parse_args()
+    configure_logging(args.verbose, args.output_file)
+
+    days = args.days or list(DAYS)
+    if args.sizes is not None:
+        # only generated inputs can grow, so the days without a generator have nothing to sweep
+        missing = [day for day in days if day not in GENERATORS]
+        if args.days and missing: parser.error(f"no input generator for {', '.join(missing)}")
+        days = [day for day in days if day in GENERATORS]
+        # sweeps aren't compared against the baseline, the sizes change from run to run
+        run_sweep(days, args.parts, args.sizes, args.seed, args.repeats, args.warmup, quiet=not args.verbose)
+        exit(0)
+    cases = build_cases(days, args.parts, not args.no_tests)
+    results = run_benchmarks(cases, args.repeats, args.warmup, quiet=not args.verbose)
+
+    wrong = [result for result in results if result['correct'] is False]
+    for result in wrong:
+        logging.info(f"Wrong answer: {format_result(result)}")
+    regressions = find_regressions(results, load_baseline(args.baseline), args.threshold, args.min_change)
+    for regression in regressions:
+        logging.info(f"Regression: {regression}")
+    if args.save_baseline:
+        save_baseline(args.baseline, results)
+        logging.info(f"Saved baseline to {args.baseline}")
+    if wrong or regressions: exit(1)
@@ -0,0 +1,90 @@
+import hashlib
+import json
+import os
+import tempfile
+
+from aoc.days import DAYS, ROOT, get_input_file, read_input, solve
+
+
+DEFAULT_CACHE_DIR = os.path.join(ROOT, '.aoc_cache')
+DEFAULT_MAX_BYTES = 16 * 1024 * 1024
+# args that change how a part reports, not what it answers
+IGNORED_ARGS = ['part', 'verbose', 'output_file']
+
+
+def hash_file(filename: str) -> str:
+    digest = hashlib.sha256()
+    with open(filename, 'rb') as f:
+        while (block := f.read(1 << 20)):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def make_key(day: str, part: int, args, input_file: str = None) -> str:
+    input_type = DAYS[day]['input']
+    if input_type == 'value' and input_file is None: input_hash = hashlib.sha256(DAYS[day]['value'].encode()).hexdigest()
+    elif input_type == 'none': input_hash = ''
+    else: input_hash = hash_file(input_file or get_input_file(day, part))
+    # editing the solver invalidates everything it has cached
+    source_hash = hash_file(os.path.join(ROOT, day, 'main.py'))
+    extra_args = sorted((k, v) for k, v in vars(args).items() if k not in IGNORED_ARGS)
+    key = json.dumps([day, part, extra_args, input_hash, source_hash], default=str)
+    return hashlib.sha256(key.encode()).hexdigest()
+
+
+class ResultCache:
+    def __init__(self, cache_dir: str = DEFAULT_CACHE_DIR, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, key + '.json')
+
+    def get(self, key: str):
+        # (found, answer), since None is a perfectly good answer
+        path = self.path(key)
+        try:
+            with open(path) as f:
+                answer = json.load(f)['answer']
+        except (FileNotFoundError, json.JSONDecodeError, KeyError):
+            return (False, None)
+        # touching the entry on every hit is what makes eviction least-recently-used
+        os.utime(path)
+        return (True, answer)
+
+    def put(self, key: str, answer) -> None:
+        # write somewhere else first so a reader never sees half an entry
+        (fd, temp_path) = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+        with os.fdopen(fd, 'w') as f:
+            json.dump({ 'answer': answer }, f)
+        os.replace(temp_path, self.path(key))
+        self.evict()
+
+    def evict(self) -> None:
+        entries = []
+        for name in os.listdir(self.cache_dir):
+            if not name.endswith('.json'): continue
+            try:
+                stat = os.stat(os.path.join(self.cache_dir, name))
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, name))
+        total = sum(size for (_, size, _) in entries)
+        for (_, size, name) in sorted(entries):
+            if total <= self.max_bytes: break
+            try:
+                os.remove(os.path.join(self.cache_dir, name))
+            except FileNotFoundError:
+                pass
+            total -= size
+
+
+def cached_solve(cache: ResultCache, day: str, part: int, args, input_file: str = None):
+    # (answer, was_cached)
+    key = make_key(day, part, args, input_file)
+    (found, answer) = cache.get(key)
+    if found: return (answer, True)
+    answer = solve(day, part, read_input(day, part, input_file), args)
+    cache.put(key, answer)
+    return (answer, False)
@@ -0,0 +1,59 @@
+import json
+import logging
+import os
+import tempfile
+import time
+
+
+# Saved progress for the long searches, so an interrupted run can carry on instead of starting over.
+# The state is whatever JSON can hold; the search saves it when due() says so,
+# and load() only hands it back when resuming, and only if it was saved for the same key
+# (the input, usually), so a stale checkpoint can't leak into a different puzzle.
+DEFAULT_INTERVAL = 60.0
+
+
+class Checkpoint:
+    def __init__(self, path: str, key, interval: float = DEFAULT_INTERVAL, resume: bool = False):
+        self.path = path
+        self.key = key
+        self.interval = interval
+        self.resume = resume
+        self.last_saved = time.monotonic()
+
+    def load(self):
+        if not self.resume: return None
+        try:
+            with open(self.path) as f:
+                saved = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            logging.info(f"No checkpoint at {self.path}, starting from scratch")
+            return None
+        if saved.get('key') != self.key:
+            logging.info(f"Checkpoint at {self.path} is for a different input, starting from scratch")
+            return None
+        logging.info(f"Resuming from {self.path}")
+        return saved['state']
+
+    def due(self) -> bool:
+        return self.interval > 0 and time.monotonic() - self.last_saved >= self.interval
+
+    def save(self, state) -> None:
+        # write somewhere else first, so a kill mid-write leaves the last checkpoint whole
+        directory = os.path.dirname(os.path.abspath(self.path))
+        (fd, temp_path) = tempfile.mkstemp(dir=directory, prefix=os.path.basename(self.path) + '.', suffix='.tmp')
+        with os.fdopen(fd, 'w') as f:
+            json.dump({ 'key': self.key, 'state': state }, f)
+        os.replace(temp_path, self.path)
+        self.last_saved = time.monotonic()
+        logging.debug(f"Checkpoint saved to {self.path}")
+
+    def clear(self) -> None:
+        # a finished search has nothing to resume
+        if self.interval > 0 and os.path.exists(self.path): os.remove(self.path)
+
+
+def from_args(args, default_path: str, key) -> Checkpoint:
+    # the runner and benchmark don't pass these, so checkpointing is off unless a script asks for it
+    path = getattr(args, 'checkpoint_file', None) or default_path
+    interval = getattr(args, 'checkpoint_interval', 0)
+    return Checkpoint(path, key, interval, getattr(args, 'resume', False))
@@ -0,0 +1,74 @@
+import logging
+import argparse
+import json
+import os
+import socket
+import sys
+
+from aoc.cache import IGNORED_ARGS
+from aoc.daemon import DEFAULT_SOCKET
+from aoc.days import DAYS, get_parts, make_args
+from aoc.runner import configure_logging
+
+
+def send_request(request: dict, socket_path: str = DEFAULT_SOCKET) -> dict:
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as connection:
+        connection.connect(socket_path)
+        connection.sendall((json.dumps(request) + '\n').encode())
+        with connection.makefile('rb') as response:
+            return json.loads(response.readline())
+
+
+def day_parser(day: str) -> argparse.ArgumentParser:
+    # the options the day's solver reads, with the same flags as its script,
+    # typed from their defaults so flags like --breakdown take no value
+    parser = argparse.ArgumentParser(prog=f"aoc.client {day}", argument_default=argparse.SUPPRESS)
+    options = {}
+    for part in get_parts(day):
+        options.update((name, value) for (name, value) in vars(make_args(day, part)).items() if name not in IGNORED_ARGS)
+    aliases = DAYS[day].get('aliases', {})
+    for (name, default) in options.items():
+        flags = [flag for (flag, alias) in aliases.items() if alias == name] + ['--' + name.replace('_', '-')]
+        if isinstance(default, bool): parser.add_argument(*flags, action='store_false' if default else 'store_true')
+        else: parser.add_argument(*flags, type=type(default))
+    return parser
+
+
+def parse_day_args(day: str, extra: list[str]) -> dict:
+    # only what was given; the daemon fills in the rest per part, like the runner does
+    return vars(day_parser(day).parse_args(extra))
+
+
+if __name__ == '__main__':
+    # no abbreviations, so they can't swallow a day's own options
+    parser = argparse.ArgumentParser(allow_abbrev=False)
+    parser.add_argument('day', nargs='?', default=None)
+    parser.add_argument('-i', '-f', '--input-file', default=None)
+    parser.add_argument('--stdin', default=False, action='store_true')
+    parser.add_argument('-o', '--output-file', default=None)
+    parser.add_argument('-v', '--verbose', '--debug', default=False, action='store_true')
+    parser.add_argument('-p', '--part', type=int, default=1)
+    # no short flag, since days use -s for their own options
+    parser.add_argument('--socket', default=DEFAULT_SOCKET)
+    parser.add_argument('--shutdown', default=False, action='store_true')
+    (args, extra) = parser.parse_known_args()
+    configure_logging(args.verbose, args.output_file)
+
+    if args.shutdown:
+        request = { 'command': 'shutdown' }
+    else:
+        if args.day is None: parser.error('a day is needed, eg. day01')
+        if args.day not in DAYS: parser.error(f"unknown day {args.day}")
+        request = { 'day': args.day, 'part': args.part, 'args': parse_day_args(args.day, extra) }
+        if args.stdin: request['input_text'] = sys.stdin.read()
+        # for day04, -i is the key itself, just like in its script
+        elif DAYS[args.day]['input'] == 'value' and args.input_file is not None: request['input_value'] = args.input_file
+        # the server has its own working directory
+        elif args.input_file is not None: request['input_file'] = os.path.abspath(args.input_file)
+    response = send_request(request, args.socket)
+    if 'error' in response:
+        logging.error(response['error'])
+        exit(1)
+    if args.shutdown: logging.info(response['answer'])
+    else: logging.info(f"Part {'One' if args.part == 1 else 'Two'}: {response['answer']}")
+    logging.debug(f"solved in {response.get('seconds', 0):.4f}s")
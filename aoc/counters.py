@@ -0,0 +1,25 @@
+import logging
+from collections import Counter
+
+# How much work a solver did, as opposed to how long it took.
+# Solvers bump these at their core steps (states expanded, hashes computed...),
+# or keep a local count in the tightest loops and add it once at the end.
+counts = Counter()
+
+
+def add(name: str, amount: int = 1) -> None:
+    counts[name] += amount
+
+
+def reset() -> None:
+    counts.clear()
+
+
+def snapshot() -> dict[str, int]:
+    return dict(counts)
+
+
+def report() -> None:
+    if len(counts) > 0: logging.info("Counters:")
+    for name, value in sorted(counts.items()):
+        logging.info(f"  {name}: {value}")
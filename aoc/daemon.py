@@ -0,0 +1,89 @@
+import logging
+import argparse
+import json
+import os
+import socketserver
+import tempfile
+import threading
+import time
+
+from aoc.days import DAYS, load_day, make_args, parse_input, read_input, solve
+from aoc.runner import configure_logging
+
+
+DEFAULT_SOCKET = os.path.join(tempfile.gettempdir(), 'aoc2015.sock')
+
+# One JSON object per line each way.
+# Request:  { "day": "day01", "part": 1, "input_file": "...", "args": { "rounds": 40 } }
+#           or "input_text" instead of "input_file" to send the input itself,
+#           or "input_value" for the days that take a value rather than a file (day04's key),
+#           or { "command": "shutdown" }
+# Response: { "answer": ..., "seconds": ... } or { "error": "..." }
+
+
+def handle_request(request: dict) -> dict:
+    day = request['day']
+    if day not in DAYS: return { 'error': f"unknown day {day}" }
+    part = int(request.get('part', 1))
+    args = make_args(day, part, **request.get('args', {}))
+    if 'input_value' in request:
+        if DAYS[day]['input'] != 'value': return { 'error': f"{day} reads an input file, not a value" }
+        input_data = request['input_value']
+    elif 'input_text' in request:
+        input_type = DAYS[day]['input']
+        if input_type == 'value': input_data = request['input_text'].strip()
+        else: input_data = parse_input(day, request['input_text'].splitlines())
+    else:
+        input_data = read_input(day, part, request.get('input_file'))
+    start = time.perf_counter()
+    answer = solve(day, part, input_data, args)
+    return { 'answer': answer, 'seconds': time.perf_counter() - start }
+
+
+class RequestHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        for line in self.rfile:
+            try:
+                request = json.loads(line)
+                if request.get('command') == 'shutdown':
+                    self.reply({ 'answer': 'shutting down' })
+                    # shutdown() waits for serve_forever to stop, so it can't run on this thread
+                    threading.Thread(target=self.server.shutdown).start()
+                    return
+                response = handle_request(request)
+            except Exception as e:
+                response = { 'error': repr(e) }
+            self.reply(response)
+
+    def reply(self, response: dict) -> None:
+        self.wfile.write((json.dumps(response, default=str) + '\n').encode())
+        self.wfile.flush()
+
+
+class SolverServer(socketserver.ThreadingUnixStreamServer):
+    daemon_threads = True
+
+
+def serve(socket_path: str) -> None:
+    # everything gets imported up front, so no request pays for it
+    for day in DAYS: load_day(day)
+    if os.path.exists(socket_path): os.remove(socket_path)
+    with SolverServer(socket_path, RequestHandler) as server:
+        logging.warning(f"Serving {len(DAYS)} days on {socket_path}")
+        try:
+            server.serve_forever()
+        finally:
+            os.remove(socket_path)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('-s', '--socket', default=DEFAULT_SOCKET)
+    parser.add_argument('-o', '--output-file', default=None)
+    parser.add_argument('-v', '--verbose', default=False, action='store_true')
+    args = parser.parse_args()
+    configure_logging(args.verbose, args.output_file)
+    # the solvers log every answer; only let that through when asked to
+    if not args.verbose: logging.disable(logging.INFO)
+
+    serve(args.socket)
@@ -0,0 +1,131 @@
+import os
+import sys
+import argparse
+import importlib.util
+
+from aoc import inputs
+
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# How each day's part_one/part_two wants to be called.
+# input: 'lines' = list of stripped lines, 'ints' = list of ints,
+#        'target' = first line as an int, 'value' = a literal string (or the first line of a given file),
+#        'none' = the part only takes args
+# input_files: per-part input file when it isn't input.txt
+# args: per-part values for the extra argparse options the day's script defines
+# aliases: the script's short flags for those options, so the client can take the same command line
+# cost: rough seconds per part from a full run, so the slow ones can be scheduled first
+# test_files/test_args: like input_files/args, for running against the puzzle's examples
+# expected: known answers per input file and part, from the notes in each day's comments
+DAYS = {
+    'day01': { 'input': 'lines', 'cost': { 1: 0.1, 2: 0.1 } },
+    'day02': { 'input': 'lines', 'args': { 'breakdown': False }, 'aliases': { '-b': 'breakdown' }, 'cost': { 1: 0.1, 2: 0.1 } },
+    'day03': { 'input': 'lines', 'args': { 'deliverers': 2 }, 'aliases': { '-n': 'deliverers' }, 'cost': { 1: 0.1, 2: 0.1 } },
+    'day04': { 'input': 'value', 'value': 'yzbqklnj', 'cost': { 1: 0.5, 2: 16.6 } },
+    'day05': { 'input': 'lines', 'cost': { 1: 0.1, 2: 0.1 } },
+    'day06': { 'input': 'lines', 'args': { 'engine': 'grid', 'grid_size': 1000 },
+        'aliases': { '-e': 'engine', '-g': 'grid_size' }, 'cost': { 1: 0.2, 2: 1.2 } },
+    'day07': { 'input': 'lines', 'input_files': { 2: 'input_2.txt' }, 'args': { 'engine': 'compiled' }, 'aliases': { '-e': 'engine' }, 'cost': { 1: 0.1, 2: 0.1 } },
+    'day08': { 'input': 'lines', 'cost': { 1: 0.1, 2: 0.1 } },
+    'day09': { 'input': 'lines', 'cost': { 1: 0.1, 2: 0.5 } },
+    'day10': { 'input': 'lines', 'args': { 1: { 'rounds': 40 }, 2: { 'rounds': 50 } }, 'aliases': { '-r': 'rounds' }, 'cost': { 1: 0.6, 2: 10.5 } },
+    'day11': { 'input': 'lines', 'cost': { 1: 0.8, 2: 3.3 } },
+    'day12': { 'input': 'lines', 'cost': { 1: 0.1, 2: 0.1 } },
+    'day13': { 'input': 'lines', 'cost': { 1: 0.1, 2: 0.6 },
+        'expected': { 'input.txt': { 1: 618, 2: 601 }, 'test_input.txt': { 1: 330 } } },
+    'day14': { 'input': 'lines', 'args': { 'race_time': 2503 }, 'aliases': { '-t': 'race_time' }, 'cost': { 1: 0.0, 2: 0.1 },
+        'test_args': { 'race_time': 1000 },
+        'expected': { 'input.txt': { 2: 1059 }, 'test_input.txt': { 2: 689 } } },
+    'day15': { 'input': 'lines', 'cost': { 1: 25.8, 2: 64.4 },
+        'expected': { 'test_input.txt': { 1: 62842880, 2: 57600000 } } },
+    'day17': { 'input': 'lines', 'args': { 'target': 150 }, 'aliases': { '-t': 'target' }, 'cost': { 1: 17.8, 2: 17.7 },
+        'test_args': { 'target': 25 },
+        'expected': { 'test_input.txt': { 1: 4 } } },
+    'day18': { 'input': 'lines', 'args': { 'steps': 100 }, 'aliases': { '-s': 'steps' }, 'cost': { 1: 3.9, 2: 3.6 },
+        'test_args': { 1: { 'steps': 4 }, 2: { 'steps': 5 } } },
+    'day19': { 'input': 'lines', 'args': { 'logging_frequency': 1000 }, 'aliases': { '-l': 'logging_frequency' }, 'cost': { 1: 0.1, 2: 0.2 },
+        'test_files': { 2: 'test_input_2.txt' } },
+    'day20': { 'input': 'target', 'args': { 'logging_interval': 0 }, 'aliases': { '-l': 'logging_interval' }, 'cost': { 1: 30.0, 2: 32.4 } },
+    'day22': { 'input': 'none', 'cost': { 1: 0.4, 2: 0.7 },
+        'expected': { None: { 1: 953, 2: 1289 } } },
+    'day23': { 'input': 'lines', 'cost': { 1: 0.1, 2: 0.1 } },
+    'day24': { 'input': 'ints', 'cost': { 1: 0.1, 2: 0.1 } },
+    'day25': { 'input': 'none', 'parts': [1], 'cost': { 1: 2.8 } },
+}
+
+_loaded_days = {}
+
+
+def load_day(day: str):
+    # the days aren't packages, so load each main.py under its day name
+    if day not in _loaded_days:
+        path = os.path.join(ROOT, day, 'main.py')
+        spec = importlib.util.spec_from_file_location(day, path)
+        module = importlib.util.module_from_spec(spec)
+        # registered so its functions can be pickled over to worker processes
+        sys.modules[day] = module
+        spec.loader.exec_module(module)
+        _loaded_days[day] = module
+    return _loaded_days[day]
+
+
+def get_parts(day: str) -> list[int]:
+    return DAYS[day].get('parts', [1, 2])
+
+
+def get_input_file(day: str, part: int) -> str:
+    input_files = DAYS[day].get('input_files', {})
+    return os.path.join(ROOT, day, input_files.get(part, 'input.txt'))
+
+
+def get_test_file(day: str, part: int) -> str:
+    # None when the day has no example input for this part
+    test_files = DAYS[day].get('test_files', {})
+    path = os.path.join(ROOT, day, test_files.get(part, 'test_input.txt'))
+    return path if os.path.exists(path) else None
+
+
+def get_expected(day: str, part: int, input_file: str = None):
+    # input_file is None for days whose input is built into the script
+    label = None if input_file is None else os.path.basename(input_file)
+    return DAYS[day].get('expected', {}).get(label, {}).get(part)
+
+
+def _part_values(day_args: dict, part: int) -> dict:
+    # per-part args are keyed by part number, shared args by option name
+    values = dict(day_args.get(part, {}))
+    values.update({k: v for k, v in day_args.items() if not isinstance(k, int)})
+    return values
+
+
+def make_args(day: str, part: int, test: bool = False, **overrides) -> argparse.Namespace:
+    values = _part_values(DAYS[day].get('args', {}), part)
+    if test: values.update(_part_values(DAYS[day].get('test_args', {}), part))
+    values.update(overrides)
+    return argparse.Namespace(part=part, verbose=False, output_file=None, **values)
+
+
+def parse_input(day: str, lines: list[str]):
+    input_type = DAYS[day]['input']
+    if input_type == 'ints': return [int(line) for line in lines]
+    if input_type == 'target': return int(lines[0])
+    return lines
+
+
+def read_input(day: str, part: int, input_file: str = None):
+    input_type = DAYS[day]['input']
+    if input_type == 'none': return None
+    if input_type == 'value':
+        # a given file holds a different value, like the keys the generators write
+        if input_file is None: return DAYS[day]['value']
+        return inputs.read_lines(input_file)[0].strip()
+    filename = input_file or get_input_file(day, part)
+    return parse_input(day, inputs.read_lines(filename))
+
+
+def solve(day: str, part: int, input_data, args: argparse.Namespace):
+    module = load_day(day)
+    part_func = module.part_one if part == 1 else module.part_two
+    if DAYS[day]['input'] == 'none': return part_func(args)
+    return part_func(input_data, args)
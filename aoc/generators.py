@@ -0,0 +1,277 @@
+import logging
+import argparse
+import itertools
+import json
+import random
+import string
+from typing import Iterator
+
+from aoc.runner import configure_logging
+
+
+# One generator per day that reads an input file, for scaling benchmarks.
+# Each takes a size (lines, moves, gates, cities... whatever grows that day's work)
+# and a seeded Random, and yields the lines of a valid input.
+# day04 and day20 take a value rather than a file, but get one anyway for --input-value/--target-gifts.
+# day22 and day25 have their puzzle input built into the script, so there's nothing to generate.
+
+def make_names(count: int, rng: random.Random) -> list[str]:
+    names = set()
+    while len(names) < count:
+        length = rng.randint(4, 9)
+        names.add(rng.choice(string.ascii_uppercase) + ''.join(rng.choices(string.ascii_lowercase, k=length)))
+    return sorted(names)
+
+
+def make_wire_name(index: int) -> str:
+    # b, c, ..., z, ba, bb, ... so nothing but the final wire is ever called 'a'
+    letters = string.ascii_lowercase[1:]
+    name = ''
+    index += 1
+    while index > 0:
+        index -= 1
+        name = letters[index % 25] + name
+        index //= 25
+    return name
+
+
+def generate_day01(size: int, rng: random.Random) -> Iterator[str]:
+    # one long line, built in pieces so a billion moves doesn't need a billion-char string.
+    # An even mix would reach the basement within a few moves, so instead it climbs for the first half
+    # and falls faster in the second, first going below 0 about 5/6 of the way in;
+    # a run of '(' at the start keeps the early wobbles from dipping under 0
+    chunk = 1 << 20
+    prefix = min(size, 64)
+    middle = max(prefix, size // 2)
+    for (start, end, weights) in [(0, prefix, [1, 0]), (prefix, middle, [3, 2]), (middle, size, [7, 13])]:
+        for chunk_start in range(start, end, chunk):
+            yield ''.join(rng.choices('()', weights=weights, k=min(chunk, end - chunk_start)))
+    yield '\n'
+
+
+def generate_day02(size: int, rng: random.Random) -> Iterator[str]:
+    for _ in range(size):
+        yield f"{rng.randint(1, 30)}x{rng.randint(1, 30)}x{rng.randint(1, 30)}\n"
+
+
+def generate_day03(size: int, rng: random.Random) -> Iterator[str]:
+    chunk = 1 << 20
+    for start in range(0, size, chunk):
+        count = min(chunk, size - start)
+        yield ''.join(rng.choices('^v<>', k=count)) + ('\n' if start + count >= size else '')
+
+
+def generate_day04(size: int, rng: random.Random) -> Iterator[str]:
+    yield ''.join(rng.choices(string.ascii_lowercase, k=size)) + '\n'
+
+
+def generate_day05(size: int, rng: random.Random) -> Iterator[str]:
+    for _ in range(size):
+        yield ''.join(rng.choices(string.ascii_lowercase, k=16)) + '\n'
+
+
+def generate_day06(size: int, rng: random.Random, grid_size: int = 1000) -> Iterator[str]:
+    for _ in range(size):
+        action = rng.choice(['turn on', 'turn off', 'toggle'])
+        (start_x, end_x) = sorted(rng.randrange(grid_size) for _ in range(2))
+        (start_y, end_y) = sorted(rng.randrange(grid_size) for _ in range(2))
+        yield f"{action} {start_x},{start_y} through {end_x},{end_y}\n"
+
+
+def generate_day07(size: int, rng: random.Random) -> Iterator[str]:
+    # build the circuit in dependency order, then shuffle it like the real input
+    input_count = max(2, size // 20)
+    lines = [f"{rng.randrange(1 << 16)} -> {make_wire_name(i)}\n" for i in range(input_count)]
+    wire_count = input_count
+    for i in range(input_count, size):
+        output = make_wire_name(i) if i < size - 1 else 'a'
+        left = make_wire_name(rng.randrange(wire_count))
+        right = make_wire_name(rng.randrange(wire_count))
+        gate = rng.choice(['AND', 'OR', 'LSHIFT', 'RSHIFT', 'NOT', 'WIRE', 'LITERAL AND'])
+        if gate in ['AND', 'OR']: lines.append(f"{left} {gate} {right} -> {output}\n")
+        elif gate in ['LSHIFT', 'RSHIFT']: lines.append(f"{left} {gate} {rng.randint(1, 15)} -> {output}\n")
+        elif gate == 'NOT': lines.append(f"NOT {left} -> {output}\n")
+        elif gate == 'WIRE': lines.append(f"{left} -> {output}\n")
+        else: lines.append(f"1 AND {left} -> {output}\n")
+        wire_count += 1
+    rng.shuffle(lines)
+    yield from lines
+
+
+def generate_day08(size: int, rng: random.Random) -> Iterator[str]:
+    pieces = string.ascii_lowercase + '!'
+    for _ in range(size):
+        value = ''
+        for _ in range(rng.randint(1, 30)):
+            kind = rng.random()
+            if kind < 0.05: value += '\\"'
+            elif kind < 0.10: value += '\\\\'
+            elif kind < 0.15: value += f"\\x{rng.randrange(256):02x}"
+            else: value += rng.choice(pieces)
+        yield f'"{value}"\n'
+
+
+def generate_day09(size: int, rng: random.Random) -> Iterator[str]:
+    for (origin, destination) in itertools.combinations(make_names(size, rng), 2):
+        yield f"{origin} to {destination} = {rng.randint(10, 150)}\n"
+
+
+def generate_day10(size: int, rng: random.Random) -> Iterator[str]:
+    yield ''.join(rng.choices('123', k=size)) + '\n'
+
+
+def generate_day11(size: int, rng: random.Random) -> Iterator[str]:
+    allowed = [c for c in string.ascii_lowercase if c not in 'iol']
+    for _ in range(size):
+        yield ''.join(rng.choices(allowed, k=8)) + '\n'
+
+
+def generate_day12(size: int, rng: random.Random) -> Iterator[str]:
+    colours = ['red', 'green', 'blue', 'yellow', 'orange', 'violet']
+
+    def build(budget: int, depth: int):
+        if budget <= 1 or depth > 8:
+            return rng.choice([rng.randint(-200, 200), rng.choice(colours)])
+        children = rng.randint(2, 6)
+        shares = [budget // children] * children
+        if rng.random() < 0.5:
+            return [build(share, depth+1) for share in shares]
+        return { string.ascii_lowercase[i]: build(share, depth+1) for i, share in enumerate(shares) }
+
+    yield json.dumps(build(size, 0), separators=(',', ':')) + '\n'
+
+
+def generate_day13(size: int, rng: random.Random) -> Iterator[str]:
+    for (person, neighbour) in itertools.permutations(make_names(size, rng), 2):
+        happiness = rng.randint(-100, 100)
+        direction = 'gain' if happiness >= 0 else 'lose'
+        yield f"{person} would {direction} {abs(happiness)} happiness units by sitting next to {neighbour}.\n"
+
+
+def generate_day14(size: int, rng: random.Random) -> Iterator[str]:
+    yield "Reindeer,speed,flight_time,rest_time\n"
+    for name in make_names(size, rng):
+        yield f"{name},{rng.randint(5, 30)},{rng.randint(3, 20)},{rng.randint(30, 180)}\n"
+
+
+def generate_day15(size: int, rng: random.Random) -> Iterator[str]:
+    for name in make_names(size, rng):
+        # mostly positive, or every recipe scores 0
+        (capacity, durability, flavour, texture) = (rng.randint(-2, 5) for _ in range(4))
+        yield f"{name}: capacity {capacity}, durability {durability}, flavor {flavour}, texture {texture}, calories {rng.randint(1, 9)}\n"
+
+
+def generate_day17(size: int, rng: random.Random) -> Iterator[str]:
+    for _ in range(size):
+        yield f"{rng.randint(5, 50)}\n"
+
+
+def generate_day18(size: int, rng: random.Random) -> Iterator[str]:
+    for _ in range(size):
+        yield ''.join(rng.choices('#.', k=size)) + '\n'
+
+
+def generate_day19(size: int, rng: random.Random) -> Iterator[str]:
+    # grow the molecule forwards from 'e' so part two always has an answer
+    # and no two rules share a right-hand side, since part two reverses them
+    elements = ['Al', 'B', 'Ca', 'F', 'H', 'Mg', 'N', 'O', 'P', 'Si', 'Th', 'Ti']
+    sources = ['e'] * 3 + [element for element in elements for _ in range(rng.randint(1, 3))]
+    replacements = []
+    targets = set()
+    for source in sources:
+        target = None
+        while target is None or target in targets:
+            target = ''.join(rng.choices(elements, k=2 if source == 'e' else rng.randint(2, 3)))
+        targets.add(target)
+        replacements.append((source, target))
+    for (source, target) in replacements:
+        yield f"{source} => {target}\n"
+    yield '\n'
+    starts = [split_elements(target) for (source, target) in replacements if source == 'e']
+    molecule = list(rng.choice(starts))
+    rules = {}
+    for (source, target) in replacements:
+        if source != 'e': rules.setdefault(source, []).append(split_elements(target))
+    while len(molecule) < size:
+        index = rng.randrange(len(molecule))
+        molecule[index:index+1] = rng.choice(rules[molecule[index]])
+    yield ''.join(molecule) + '\n'
+
+
+def split_elements(molecule: str) -> list[str]:
+    elements = []
+    for char in molecule:
+        if char.isupper() or not elements: elements.append(char)
+        else: elements[-1] += char
+    return elements
+
+
+def generate_day20(size: int, rng: random.Random) -> Iterator[str]:
+    yield f"{size}\n"
+
+
+def generate_day23(size: int, rng: random.Random) -> Iterator[str]:
+    # Built as blocks, and jumps only go forwards to the start of a block, so every program finishes.
+    # hlf only ever comes guarded, as 'jie r, +2 / jmp +2 / hlf r', so it never halves an odd number;
+    # nothing can jump into the middle of that block past the guard.
+    blocks = []
+    count = 0
+    while count < size:
+        kind = rng.choice(['hlf', 'tpl', 'inc', 'inc', 'jmp', 'jie', 'jio'])
+        register = rng.choice('ab')
+        if kind == 'hlf' and count + 3 <= size: blocks.append([f"jie {register}, +2", "jmp +2", f"hlf {register}"])
+        elif kind in ['jmp', 'jie', 'jio']: blocks.append([(kind, register)])
+        else: blocks.append([f"{'inc' if kind == 'hlf' else kind} {register}"])
+        count += len(blocks[-1])
+    starts = list(itertools.accumulate((len(block) for block in blocks), initial=0))
+    for (index, block) in enumerate(blocks):
+        if isinstance(block[0], str):
+            yield from (line + '\n' for line in block)
+            continue
+        (kind, register) = block[0]
+        # anywhere up to five blocks on, or straight off the end
+        offset = starts[rng.randint(index + 1, min(index + 5, len(blocks)))] - starts[index]
+        if kind == 'jmp': yield f"jmp +{offset}\n"
+        else: yield f"{kind} {register}, +{offset}\n"
+
+
+def generate_day24(size: int, rng: random.Random) -> Iterator[str]:
+    # distinct weights whose total splits into both 3 and 4 equal groups
+    weights = sorted(rng.sample(range(1, size * 4), size))
+    while sum(weights) % 12 != 0:
+        weights[-1] += 1
+    for weight in weights:
+        yield f"{weight}\n"
+
+
+GENERATORS = {
+    'day01': generate_day01, 'day02': generate_day02, 'day03': generate_day03,
+    'day04': generate_day04, 'day05': generate_day05, 'day06': generate_day06,
+    'day07': generate_day07, 'day08': generate_day08, 'day09': generate_day09,
+    'day10': generate_day10, 'day11': generate_day11, 'day12': generate_day12,
+    'day13': generate_day13, 'day14': generate_day14, 'day15': generate_day15,
+    'day17': generate_day17, 'day18': generate_day18, 'day19': generate_day19,
+    'day20': generate_day20, 'day23': generate_day23, 'day24': generate_day24,
+}
+
+
+def generate(day: str, size: int, seed: int, output_file: str) -> None:
+    rng = random.Random(seed)
+    with open(output_file, 'w') as f:
+        for line in GENERATORS[day](size, rng):
+            f.write(line)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('-d', '--day', required=True, choices=list(GENERATORS))
+    parser.add_argument('-n', '--size', type=int, required=True)
+    parser.add_argument('-s', '--seed', type=int, default=2015)
+    parser.add_argument('-f', '--input-file', required=True)
+    parser.add_argument('-o', '--output-file', default=None)
+    parser.add_argument('-v', '--verbose', default=False, action='store_true')
+    args = parser.parse_args()
+    configure_logging(args.verbose, args.output_file)
+
+    generate(args.day, args.size, args.seed, args.input_file)
+    logging.info(f"Wrote {args.day} input of size {args.size} (seed {args.seed}) to {args.input_file}")
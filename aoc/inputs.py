@@ -0,0 +1,38 @@
+import mmap
+from contextlib import contextmanager
+from typing import Iterator
+
+
+# Three ways to get at an input file, from most to least memory:
+# read_lines() is what every day has always done,
+# iter_lines() hands over one line at a time for days that only scan once,
+# and open_view() maps the file so nothing is copied until it's looked at.
+
+def read_lines(filename: str) -> list[str]:
+    with open(filename) as input_file:
+        return [line.rstrip('\n') for line in input_file]
+
+
+def iter_lines(filename: str) -> Iterator[str]:
+    with open(filename) as input_file:
+        for line in input_file:
+            yield line.rstrip('\n')
+
+
+@contextmanager
+def open_view(filename: str) -> Iterator[memoryview]:
+    with open(filename, 'rb') as input_file:
+        # mmap refuses empty files
+        if input_file.seek(0, 2) == 0:
+            yield memoryview(b'')
+            return
+        with mmap.mmap(input_file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            # the view has to be released before the map can close
+            with memoryview(mapped) as view:
+                yield view
+
+
+def iter_blocks(view: memoryview, block_size: int = 1 << 22) -> Iterator[memoryview]:
+    # zero-copy slices of the mapped file, for scanners that work on raw bytes
+    for start in range(0, len(view), block_size):
+        yield view[start:start + block_size]
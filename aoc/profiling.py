@@ -0,0 +1,78 @@
+import cProfile
+import io
+import logging
+import os
+import pstats
+import tracemalloc
+from collections import defaultdict
+
+
+# rows in each of the reports
+REPORT_LIMIT = 30
+
+
+def run(part_func, *part_args):
+    # every part takes the parsed command line as its last argument
+    args = part_args[-1]
+    if not getattr(args, 'profile', False): return part_func(*part_args)
+
+    base = os.path.splitext(args.output_file)[0] if args.output_file else 'profile'
+    base = f"{base}_part{getattr(args, 'part', 1)}"
+    profiler = cProfile.Profile()
+    # one run under both, since the slow days are too slow to run twice;
+    # tracemalloc inflates the times a little but not the ranking
+    tracemalloc.start()
+    profiler.enable()
+    try:
+        answer = part_func(*part_args)
+    finally:
+        profiler.disable()
+        snapshot = tracemalloc.take_snapshot()
+        (_, peak) = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    stats = pstats.Stats(profiler)
+    write_hot_functions(stats, base + '.pstats.txt', REPORT_LIMIT)
+    write_allocations(snapshot, peak, base + '.alloc.txt', REPORT_LIMIT)
+    write_callgrind(stats, base + '.callgrind')
+    logging.info(f"Profile written to {base}.pstats.txt, {base}.alloc.txt and {base}.callgrind")
+    return answer
+
+
+def write_hot_functions(stats: pstats.Stats, filename: str, limit: int) -> None:
+    report = io.StringIO()
+    stats.stream = report
+    stats.sort_stats(pstats.SortKey.TIME).print_stats(limit)
+    stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(limit)
+    with open(filename, 'w') as f:
+        f.write(report.getvalue())
+
+
+def write_allocations(snapshot: tracemalloc.Snapshot, peak: int, filename: str, limit: int) -> None:
+    with open(filename, 'w') as f:
+        f.write(f"Peak traced memory: {peak / 1024:.1f} KB\n\n")
+        for statistic in snapshot.statistics('lineno')[:limit]:
+            frame = statistic.traceback[0]
+            f.write(f"{statistic.size / 1024:10.1f} KB {statistic.count:10} blocks  {frame.filename}:{frame.lineno}\n")
+
+
+def write_callgrind(stats: pstats.Stats, filename: str) -> None:
+    # pstats only records callers, callgrind wants callees
+    callees = defaultdict(dict)
+    for func, (_, _, _, _, callers) in stats.stats.items():
+        for caller, caller_stats in callers.items():
+            callees[caller][func] = caller_stats
+
+    def microseconds(seconds):
+        return int(seconds * 1000000)
+
+    with open(filename, 'w') as f:
+        f.write("# callgrind format\nversion: 1\ncreator: aoc.profiling\nevents: Microseconds\n\n")
+        for func, (_, _, total_time, _, _) in stats.stats.items():
+            (path, line, name) = func
+            f.write(f"fl={path}\nfn={name}\n{line} {microseconds(total_time)}\n")
+            for callee, (_, call_count, _, cumulative_time) in callees[func].items():
+                (callee_path, callee_line, callee_name) = callee
+                f.write(f"cfl={callee_path}\ncfn={callee_name}\n")
+                f.write(f"calls={call_count} {callee_line}\n{line} {microseconds(cumulative_time)}\n")
+            f.write("\n")
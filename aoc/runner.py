@@ -0,0 +1,164 @@
+import logging
+import argparse
+import glob
+import json
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, as_completed, wait
+
+from aoc import counters
+from aoc.cache import DEFAULT_CACHE_DIR, DEFAULT_MAX_BYTES, ResultCache, cached_solve
+from aoc.days import DAYS, get_parts, load_day, make_args, read_input, solve
+
+
+def configure_logging(verbose, output_file):
+    log_level = logging.DEBUG if verbose else logging.INFO
+    if output_file is None:
+        logging.basicConfig(
+            format='%(message)s',
+            level=log_level
+        )
+    else:
+        logging.basicConfig(
+            format='%(message)s',
+            level=log_level,
+            filename=output_file,
+            filemode='w'
+        )
+
+
+def build_jobs(days: list[str], parts: list[int]) -> list[tuple[str, int]]:
+    jobs = [(day, part) for day in days for part in get_parts(day) if part in parts]
+    # longest first, so the slowest day starts straight away
+    # instead of being picked up by whichever worker frees up last
+    return sorted(jobs, key=lambda job: DAYS[job[0]]['cost'].get(job[1], 0), reverse=True)
+
+
+def init_worker() -> None:
+    # the solvers log their own answers, which would only get mixed into the summary
+    logging.disable(logging.INFO)
+
+
+def run_job(day: str, part: int, cache_dir: str = None, cache_max_bytes: int = DEFAULT_MAX_BYTES) -> dict:
+    args = make_args(day, part)
+    counters.reset()
+    start = time.perf_counter()
+    cached = False
+    if cache_dir is None:
+        answer = solve(day, part, read_input(day, part), args)
+    else:
+        (answer, cached) = cached_solve(ResultCache(cache_dir, cache_max_bytes), day, part, args)
+    seconds = time.perf_counter() - start
+    return { 'day': day, 'part': part, 'answer': answer, 'seconds': seconds, 'cached': cached, 'counters': counters.snapshot() }
+
+
+def run_all(jobs: list[tuple[str, int]], workers: int, cache_dir: str = None, cache_max_bytes: int = DEFAULT_MAX_BYTES) -> list[dict]:
+    results = []
+    with ProcessPoolExecutor(max_workers=workers, initializer=init_worker) as executor:
+        futures = { executor.submit(run_job, day, part, cache_dir, cache_max_bytes): (day, part) for day, part in jobs }
+        for future in as_completed(futures):
+            (day, part) = futures[future]
+            try:
+                result = future.result()
+            except Exception as e:
+                result = { 'day': day, 'part': part, 'answer': None, 'seconds': None, 'error': repr(e) }
+            results.append(result)
+    return sorted(results, key=lambda r: (r['day'], r['part']))
+
+
+def find_batch_files(pattern: str) -> list[str]:
+    if os.path.isdir(pattern):
+        return sorted(os.path.join(pattern, name) for name in os.listdir(pattern)
+            if os.path.isfile(os.path.join(pattern, name)))
+    return sorted(glob.glob(pattern))
+
+
+def init_batch_worker(day: str) -> None:
+    # import the day once per worker, and keep the solvers' own logging out of the JSON
+    load_day(day)
+    logging.disable(logging.INFO)
+
+
+def solve_batch_item(day: str, part: int, input_file: str, input_data) -> dict:
+    counters.reset()
+    start = time.perf_counter()
+    answer = solve(day, part, input_data, make_args(day, part))
+    seconds = time.perf_counter() - start
+    return { 'day': day, 'part': part, 'input_file': input_file, 'answer': answer, 'seconds': seconds, 'counters': counters.snapshot() }
+
+
+def run_batch(day: str, parts: list[int], input_files: list[str], workers: int, io_workers: int):
+    # files are read and parsed on threads, solved on processes,
+    # and the results come back in whatever order they finish.
+    # Reads only run a little ahead of the solvers, so only a few parsed inputs are ever held at once
+    parts = [part for part in get_parts(day) if part in parts]
+    max_solves = 2 * workers * len(parts)
+    remaining = iter(input_files)
+    with ThreadPoolExecutor(max_workers=io_workers) as readers, \
+            ProcessPoolExecutor(max_workers=workers, initializer=init_batch_worker, initargs=(day,)) as solvers:
+        reads = {}
+        solves = {}
+        while True:
+            while len(reads) < io_workers and len(solves) + len(reads) * len(parts) < max_solves:
+                input_file = next(remaining, None)
+                if input_file is None: break
+                reads[readers.submit(read_input, day, parts[0], input_file)] = input_file
+            if len(reads) == 0 and len(solves) == 0: break
+            (done, _) = wait(list(reads) + list(solves), return_when=FIRST_COMPLETED)
+            for future in done:
+                if future in reads:
+                    input_file = reads.pop(future)
+                    try:
+                        input_data = future.result()
+                    except Exception as e:
+                        yield { 'day': day, 'part': None, 'input_file': input_file, 'answer': None, 'error': repr(e) }
+                        continue
+                    for part in parts:
+                        solves[solvers.submit(solve_batch_item, day, part, input_file, input_data)] = (part, input_file)
+                    continue
+                (part, input_file) = solves.pop(future)
+                try:
+                    yield future.result()
+                except Exception as e:
+                    yield { 'day': day, 'part': part, 'input_file': input_file, 'answer': None, 'error': repr(e) }
+
+
+def format_result(result: dict) -> str:
+    if 'error' in result:
+        return f"{result['day']} part {result['part']}: ERROR {result['error']}"
+    cached = ', cached' if result.get('cached') else ''
+    work = ''.join(f", {name} {value}" for name, value in sorted(result.get('counters', {}).items()))
+    return f"{result['day']} part {result['part']}: {result['answer']} ({result['seconds']:.3f}s{cached}{work})"
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('-d', '--days', nargs='+', default=None)
+    parser.add_argument('-p', '--parts', type=int, nargs='+', default=[1, 2])
+    parser.add_argument('-j', '--workers', type=int, default=os.cpu_count())
+    parser.add_argument('-b', '--batch', default=None)
+    parser.add_argument('--io-workers', type=int, default=8)
+    parser.add_argument('-c', '--cache-dir', default=DEFAULT_CACHE_DIR)
+    parser.add_argument('--cache-max-bytes', type=int, default=DEFAULT_MAX_BYTES)
+    parser.add_argument('--no-cache', default=False, action='store_true')
+    parser.add_argument('-o', '--output-file', default=None)
+    parser.add_argument('-v', '--verbose', default=False, action='store_true')
+    args = parser.parse_args()
+    configure_logging(args.verbose, args.output_file)
+
+    if args.batch is not None:
+        # one day against every file in a directory (or matching a glob), as JSON lines
+        if args.days is None or len(args.days) != 1: parser.error('--batch needs exactly one day in --days')
+        if DAYS[args.days[0]]['input'] in ['none', 'value']: parser.error(f"{args.days[0]} doesn't read an input file")
+        input_files = find_batch_files(args.batch)
+        for result in run_batch(args.days[0], args.parts, input_files, args.workers, args.io_workers):
+            logging.info(json.dumps(result, default=str))
+        exit(0)
+
+    days = args.days or list(DAYS)
+    jobs = build_jobs(days, args.parts)
+    start = time.perf_counter()
+    results = run_all(jobs, args.workers, None if args.no_cache else args.cache_dir, args.cache_max_bytes)
+    for result in results:
+        logging.info(format_result(result))
+    logging.info(f"{len(results)} parts in {time.perf_counter() - start:.3f}s")
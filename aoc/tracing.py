@@ -0,0 +1,35 @@
+import atexit
+import logging
+from collections import deque
+
+# Hot loops guard every call with `if tracing.enabled:` so a normal run
+# pays for one global lookup and nothing gets formatted.
+# When it's on, events keep their raw values in a ring buffer
+# and only get turned into strings when they're flushed to the log.
+enabled = False
+_events = deque()
+
+
+def enable(capacity: int = 100000) -> None:
+    global enabled, _events
+    if not enabled: atexit.register(flush)
+    _events = deque(_events, maxlen=capacity)
+    enabled = True
+
+
+def disable() -> None:
+    global enabled
+    enabled = False
+
+
+def event(message: str, *values) -> None:
+    # message uses %-style placeholders, filled in by flush()
+    _events.append((message, values))
+
+
+def flush() -> None:
+    dropped = _events.maxlen is not None and len(_events) == _events.maxlen
+    if dropped: logging.debug(f"(trace buffer full, only the last {_events.maxlen} events were kept)")
+    while len(_events) > 0:
+        (message, values) = _events.popleft()
+        logging.debug(message % values if values else message)
@@ -1,5 +1,20 @@
 import logging
 import argparse
+import itertools
+import math
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from functools import reduce
+from typing import Iterable, Union
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from aoc import inputs, profiling
 
 def configure_logging(verbose, output_file):
     log_level = logging.DEBUG if verbose else logging.INFO
@@ -16,23 +31,139 @@ def configure_logging(verbose, output_file):
             filemode='w'
         )
 
+UP = ord('(')
+DOWN = ord(')')
+
+def find_basement(chunk: bytes, floor: int) -> int:
+    # index of the first move in this chunk that goes below ground, if there is one
+    if np is not None:
+        values = np.frombuffer(chunk, dtype=np.uint8)
+        steps = (values == UP).astype(np.int64) - (values == DOWN)
+        below = (floor + np.cumsum(steps)) < 0
+        return int(below.argmax()) if below.any() else None
+    for index, value in enumerate(chunk):
+        if value == UP: floor += 1
+        elif value == DOWN:
+            floor -= 1
+            if floor < 0: return index
+    return None
+
+# Works through the input a chunk at a time, lines or blocks of the mapped file.
+# The floor only needs bytes.count; a chunk only gets walked move by move
+# when it has enough ')' to take us from the current floor into the basement.
+def scan_floors(input_data: Iterable[Union[str, bytes, memoryview]], stop_at_basement: bool = False) -> tuple[int, int]:
+    floor = 0
+    position = 0
+    basement = None
+    for chunk in input_data:
+        chunk = chunk.encode('ascii') if isinstance(chunk, str) else bytes(chunk)
+        downs = chunk.count(b')')
+        if basement is None and floor - downs < 0:
+            index = find_basement(chunk, floor)
+            if index is not None:
+                basement = position + index + 1
+                if stop_at_basement: break
+        floor += chunk.count(b'(') - downs
+        position += len(chunk)
+    return (floor, basement)
+
+
+# Parallel version: each worker summarises one byte range of the file as
+# (net change, lowest floor relative to the range's start, index of the first time it got there),
+# and the summaries combine left to right like one long range would.
+STEPS = [1 if value == UP else -1 if value == DOWN else 0 for value in range(256)]
+
+def summarise_range(filename: str, start: int, end: int) -> tuple[int, float, int]:
+    with inputs.open_view(filename) as view:
+        chunk = bytes(view[start:end])
+    if len(chunk) == 0: return (0, math.inf, None)
+    if np is not None:
+        values = np.frombuffer(chunk, dtype=np.uint8)
+        floors = np.cumsum((values == UP).astype(np.int64) - (values == DOWN))
+        lowest_index = int(floors.argmin())
+        return (int(floors[-1]), int(floors[lowest_index]), start + lowest_index)
+    floors = list(itertools.accumulate(map(STEPS.__getitem__, chunk)))
+    lowest = min(floors)
+    return (floors[-1], lowest, start + floors.index(lowest))
+
+def combine(left: tuple[int, float, int], right: tuple[int, float, int]) -> tuple[int, float, int]:
+    (left_change, left_lowest, left_index) = left
+    (right_change, right_lowest, right_index) = right
+    # ties go left, so the index is always the first time we hit the lowest floor
+    if left_lowest <= left_change + right_lowest:
+        return (left_change + right_change, left_lowest, left_index)
+    return (left_change + right_change, left_change + right_lowest, right_index)
+
+def parallel_scan(filename: str, workers: int, block_size: int) -> tuple[int, int]:
+    size = os.path.getsize(filename)
+    starts = list(range(0, size, block_size))
+    ends = [min(start + block_size, size) for start in starts]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        summaries = list(executor.map(summarise_range, [filename] * len(starts), starts, ends))
+    (floor, _, _) = reduce(combine, summaries, (0, math.inf, None))
+    # the first range whose lowest point is underground holds the basement;
+    # if it only just touches -1, that lowest point is the answer,
+    # otherwise it went further down, so walk that one range to find where it crossed
+    basement = None
+    before = (0, math.inf, None)
+    for (start, end, summary) in zip(starts, ends, summaries):
+        if before[0] + summary[1] <= -1:
+            if before[0] + summary[1] == -1:
+                basement = summary[2] + 1
+            else:
+                with inputs.open_view(filename) as view:
+                    basement = start + find_basement(bytes(view[start:end]), before[0]) + 1
+            break
+        before = combine(before, summary)
+    return (floor, basement)
+
+
+def part_one(input_data: Iterable[Union[str, bytes, memoryview]], args) -> int:
+    (floor, _) = scan_floors(input_data)
+    logging.info(f"Part One: {floor}")
+    return floor
+
+
+def part_two(input_data: Iterable[Union[str, bytes, memoryview]], args) -> int:
+    (_, position) = scan_floors(input_data, stop_at_basement=True)
+    if position is None: logging.info(f"Part Two: Never entered the basement")
+    else: logging.info(f"Part Two: Entering basement at position {position}")
+    return position
+
+
+
+def part_one_parallel(filename: str, args) -> int:
+    (floor, _) = parallel_scan(filename, args.workers, args.block_size)
+    logging.info(f"Part One: {floor}")
+    return floor
+
+
+def part_two_parallel(filename: str, args) -> int:
+    (_, position) = parallel_scan(filename, args.workers, args.block_size)
+    if position is None: logging.info(f"Part Two: Never entered the basement")
+    else: logging.info(f"Part Two: Entering basement at position {position}")
+    return position
+
+
 if __name__ == '__main__':
     parser = argparse.ArgumentParser()
     parser.add_argument('-i', '-f', '--input-file', default='input.txt')
     parser.add_argument('-o', '--output-file', default=None)
     parser.add_argument('-v', '--verbose', '--debug', default=False, action='store_true')
+    parser.add_argument('-p', '--part', type=int, default=1)
+    parser.add_argument('--profile', default=False, action='store_true')
+    parser.add_argument('-j', '--workers', type=int, default=1)
+    parser.add_argument('-b', '--block-size', type=int, default=1 << 24)
     args = parser.parse_args()
     configure_logging(args.verbose, args.output_file)
 
     filename = args.input_file
-    change = { '(': 1, ')': -1 }
-    floor = 0
-    basement_found = False
-    with open(filename) as input_file:
-        for line in input_file:
-            for char_index,char in enumerate(line):
-                floor += change.get(char, 0)
-                if floor == -1 and not basement_found:
-                    print(f"Entering basement at position {char_index+1}")
-                    basement_found = True
-    print(floor)
+    if args.workers > 1:
+        if args.part == 1: profiling.run(part_one_parallel, filename, args)
+        elif args.part == 2: profiling.run(part_two_parallel, filename, args)
+        exit(0)
+    # the whole input is one line, so read it in blocks straight off the mapped file
+    with inputs.open_view(filename) as view:
+        input_data = inputs.iter_blocks(view)
+        if args.part == 1: profiling.run(part_one, input_data, args)
+        elif args.part == 2: profiling.run(part_two, input_data, args)
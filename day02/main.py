@@ -1,6 +1,19 @@
 import logging
 import argparse
 import itertools
+import json
+import os
+import sys
+import time
+from typing import Iterable
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from aoc import inputs, profiling
 
 def configure_logging(verbose, output_file):
     log_level = logging.DEBUG if verbose else logging.INFO
@@ -18,30 +31,144 @@ def configure_logging(verbose, output_file):
         )
 
 
+def measure_box(line: str) -> tuple[int, int]:
+    dimensions = sorted(int(d) for d in line.split('x'))
+    areas = []
+    areas.append(dimensions[0] * dimensions[1])
+    areas.append(2 * dimensions[0] * dimensions[1])
+    areas.append(2 * dimensions[0] * dimensions[2])
+    areas.append(2 * dimensions[1] * dimensions[2])
+    paper_needed = sum(areas)
+    perimeter = 2 * (dimensions[0] + dimensions[1])
+    volume = dimensions[0] * dimensions[1] * dimensions[2]
+    ribbon = perimeter + volume
+    logging.debug(f"{dimensions}: Paper = {areas} => {paper_needed}, ribbon = {perimeter} + bow {volume} = {ribbon}")
+    return (paper_needed, ribbon)
+
+
+# Columnar version: a whole batch of lines becomes one list of numbers,
+# three per box, so there's no per-line split/sort/areas list.
+# Sorted smallest first as (a, b, c), a box needs
+#   paper  = 3ab + 2ac + 2bc  (the smallest side is ab, counted once extra as slack)
+#   ribbon = 2(a + b) + abc
+BATCH_SIZE = 1 << 16
+
+def measure_batch(lines: list[str]) -> tuple[int, int]:
+    numbers = ' '.join(lines).replace('x', ' ').split()
+    if np is not None:
+        boxes = np.array(numbers, dtype=np.int64).reshape(-1, 3)
+        boxes.sort(axis=1)
+        (a, b, c) = (boxes[:, 0], boxes[:, 1], boxes[:, 2])
+        paper = int((3 * a * b + 2 * a * c + 2 * b * c).sum())
+        ribbon = int((2 * (a + b) + a * b * c).sum())
+        return (paper, ribbon)
+    paper = 0
+    ribbon = 0
+    values = iter(map(int, numbers))
+    for dimensions in zip(values, values, values):
+        (a, b, c) = sorted(dimensions)
+        paper += 3 * a * b + 2 * a * c + 2 * b * c
+        ribbon += 2 * (a + b) + a * b * c
+    return (paper, ribbon)
+
+
+def measure_boxes(input_data: Iterable[str], breakdown: bool) -> tuple[int, int]:
+    if breakdown:
+        # box by box, so each one gets its debug line
+        measurements = [measure_box(line) for line in input_data if line]
+        return (sum(m[0] for m in measurements), sum(m[1] for m in measurements))
+    total_paper = 0
+    total_ribbon = 0
+    lines = iter(input_data)
+    # batches keep memory flat on huge streamed inputs
+    while (batch := list(itertools.islice(lines, BATCH_SIZE))):
+        (paper, ribbon) = measure_batch(batch)
+        total_paper += paper
+        total_ribbon += ribbon
+    return (total_paper, total_ribbon)
+
+
+# Follow mode, for a file that keeps growing: the byte offset reached and the running totals
+# are kept in a state file, so each wake-up only measures the lines appended since the last.
+def load_follow_state(state_file: str) -> dict:
+    if not os.path.exists(state_file): return { 'offset': 0, 'total_paper': 0, 'total_ribbon': 0 }
+    with open(state_file) as f:
+        return json.load(f)
+
+
+def save_follow_state(state_file: str, state: dict) -> None:
+    # written aside and renamed, so a crash never leaves half a state file
+    temp_file = state_file + '.tmp'
+    with open(temp_file, 'w') as f:
+        json.dump(state, f)
+    os.replace(temp_file, state_file)
+
+
+def read_appended(input_file, state: dict) -> Iterable[str]:
+    for line in input_file:
+        # a line without its newline is still being written, so leave it for next time
+        if not line.endswith(b'\n'): break
+        state['offset'] += len(line)
+        yield line.decode().rstrip('\n')
+
+
+def follow_update(filename: str, state_file: str, breakdown: bool) -> dict:
+    state = load_follow_state(state_file)
+    with open(filename, 'rb') as input_file:
+        if input_file.seek(0, 2) < state['offset']:
+            logging.warning(f"{filename} is shorter than before, starting again")
+            state = { 'offset': 0, 'total_paper': 0, 'total_ribbon': 0 }
+        start = state['offset']
+        input_file.seek(start)
+        (paper, ribbon) = measure_boxes(read_appended(input_file, state), breakdown)
+    state['total_paper'] += paper
+    state['total_ribbon'] += ribbon
+    logging.debug(f"Measured bytes {start} to {state['offset']}: paper +{paper}, ribbon +{ribbon}")
+    save_follow_state(state_file, state)
+    return state
+
+
+def follow(filename: str, state_file: str, interval: float, breakdown: bool) -> None:
+    while True:
+        state = follow_update(filename, state_file, breakdown)
+        logging.info(f"Paper: {state['total_paper']}, Ribbon: {state['total_ribbon']}")
+        # no interval means a single wake-up, eg. from cron
+        if interval <= 0: return
+        time.sleep(interval)
+
+
+def part_one(input_data: Iterable[str], args) -> int:
+    (total_paper, _) = measure_boxes(input_data, args.breakdown)
+    logging.info(f"Part One: Paper: {total_paper}")
+    return total_paper
+
+
+def part_two(input_data: Iterable[str], args) -> int:
+    (_, total_ribbon) = measure_boxes(input_data, args.breakdown)
+    logging.info(f"Part Two: Ribbon: {total_ribbon}")
+    return total_ribbon
+
+
 if __name__ == '__main__':
     parser = argparse.ArgumentParser()
     parser.add_argument('-i', '-f', '--input-file', default='input.txt')
     parser.add_argument('-o', '--output-file', default=None)
     parser.add_argument('-v', '--verbose', '--debug', default=False, action='store_true')
+    parser.add_argument('-p', '--part', type=int, default=1)
+    parser.add_argument('--profile', default=False, action='store_true')
+    parser.add_argument('-b', '--breakdown', default=False, action='store_true')
+    parser.add_argument('--follow', default=False, action='store_true')
+    parser.add_argument('--state-file', default=None)
+    parser.add_argument('--interval', type=float, default=0)
     args = parser.parse_args()
     configure_logging(args.verbose, args.output_file)
 
     filename = args.input_file
-    total_paper = 0
-    total_ribbon = 0
-    with open(filename) as input_file:
-        while (line := input_file.readline().rstrip()):
-            dimensions = sorted(int(d) for d in line.split('x'))
-            areas = []
-            areas.append(dimensions[0] * dimensions[1])
-            areas.append(2 * dimensions[0] * dimensions[1])
-            areas.append(2 * dimensions[0] * dimensions[2])
-            areas.append(2 * dimensions[1] * dimensions[2])
-            paper_needed = sum(areas)
-            perimeter = 2 * (dimensions[0] + dimensions[1])
-            volume = dimensions[0] * dimensions[1] * dimensions[2]
-            ribbon = perimeter + volume
-            logging.debug(f"{dimensions}: Paper = {areas} => {paper_needed}, ribbon = {perimeter} + bow {volume} = {ribbon}")
-            total_paper += paper_needed
-            total_ribbon += ribbon
-    logging.info(f"Paper: {total_paper}, Ribbon: {total_ribbon}")
+    if args.follow:
+        state_file = args.state_file if args.state_file is not None else filename + '.follow.json'
+        follow(filename, state_file, args.interval, args.breakdown)
+        exit(0)
+    # these parts only scan once, so there's no need to hold the whole file
+    input_data = inputs.iter_lines(filename)
+    if args.part == 1: profiling.run(part_one, input_data, args)
+    elif args.part == 2: profiling.run(part_two, input_data, args)
@@ -1,5 +1,18 @@
 import logging
 import argparse
+import os
+import re
+import sys
+from array import array
+from itertools import accumulate
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from aoc import profiling
 
 def configure_logging(verbose, output_file):
     log_level = logging.DEBUG if verbose else logging.INFO
@@ -23,39 +36,107 @@ location_delta = {
     '<': (-1, 0)
 }
 
-def part_one(input_data: list[str], args) -> None:
+# Compact visited set: a walk is two columns of coordinates (every position, starting at 0, 0)
+# rather than a tuple per house, and the houses are counted without ever holding a set of tuples.
+# Coordinates are 32 bits, which no walk that fits in memory can outgrow.
+# With NumPy each house packs into one int64 and a sort counts the distinct ones;
+# without, they're marked in a bitmap over the bounding box.
+BITMAP_LIMIT = 16
+
+if np is not None:
+    x_steps = np.zeros(256, dtype=np.int8)
+    y_steps = np.zeros(256, dtype=np.int8)
+    is_move = np.zeros(256, dtype=bool)
+    for (char, (dx, dy)) in location_delta.items():
+        x_steps[ord(char)] = dx
+        y_steps[ord(char)] = dy
+        is_move[ord(char)] = True
+
+# anything that isn't a move, for the fallback to drop
+not_a_move = re.compile('[^' + re.escape(''.join(location_delta)) + ']')
+
+def encode(line: str):
+    # the moves alone, as bytes in an array with NumPy, so slicing them is a view
+    if np is not None:
+        raw = np.frombuffer(line.encode(), dtype=np.uint8)
+        return raw[is_move[raw]]
+    return not_a_move.sub('', line)
+
+
+def walk(moves):
+    if np is not None:
+        xs = np.zeros(len(moves) + 1, dtype=np.int32)
+        ys = np.zeros(len(moves) + 1, dtype=np.int32)
+        np.cumsum(x_steps[moves], dtype=np.int32, out=xs[1:])
+        np.cumsum(y_steps[moves], dtype=np.int32, out=ys[1:])
+        return (xs, ys)
+    xs = array('i', accumulate((location_delta[char][0] for char in moves), initial=0))
+    ys = array('i', accumulate((location_delta[char][1] for char in moves), initial=0))
+    return (xs, ys)
+
+
+def count_visited(walks: list) -> int:
+    # houses visited by any of the walks, each counted once
+    if np is not None:
+        keys = np.empty(sum(len(xs) for (xs, _) in walks), dtype=np.int64)
+        start = 0
+        for (xs, ys) in walks:
+            packed = keys[start:start + len(xs)]
+            packed[:] = xs
+            packed <<= 32
+            packed += ys
+            start += len(xs)
+        # sorting in place, rather than np.unique, saves another copy of the keys
+        keys.sort()
+        return int(np.count_nonzero(keys[1:] != keys[:-1])) + 1
+    min_x = min(min(xs) for (xs, _) in walks)
+    max_x = max(max(xs) for (xs, _) in walks)
+    min_y = min(min(ys) for (_, ys) in walks)
+    max_y = max(max(ys) for (_, ys) in walks)
+    height = max_y - min_y + 1
+    area = (max_x - min_x + 1) * height
+    positions = sum(len(xs) for (xs, _) in walks)
+    if area <= BITMAP_LIMIT * positions:
+        visited = bytearray(area)
+        for (xs, ys) in walks:
+            for (x, y) in zip(xs, ys):
+                visited[(x - min_x) * height + (y - min_y)] = 1
+        return visited.count(1)
+    # a long straight route has a bounding box far bigger than the route, so pack into a set instead
+    visited = set()
+    for (xs, ys) in walks:
+        visited.update((x - min_x) * height + (y - min_y) for (x, y) in zip(xs, ys))
+    return len(visited)
+
+
+def count_fleet(moves, deliverers: int) -> int:
+    # deliverers take turns, so each one's walk is every n-th move, starting from their turn
+    return count_visited([walk(moves[i::deliverers]) for i in range(deliverers)])
+
+
+def part_one(input_data: list[str], args) -> int:
+    visited = None
+    for line in input_data:
+        visited = count_visited([walk(encode(line))])
+        logging.debug(line)
+        logging.info(visited)
+    return visited
+
+def part_two(input_data: list[str], args) -> int:
+    # Santa and one robot, or a bigger fleet with --deliverers
+    visited = None
     for line in input_data:
-        location = (0, 0)
-        visited = set()
-        visited.add(location)
-        for char in line:
-            if char not in location_delta: continue
-            move = location_delta[char]
-            location = (
-                location[0] + move[0],
-                location[1] + move[1])
-            visited.add(location)
+        visited = count_fleet(encode(line), args.deliverers)
         logging.debug(line)
-        logging.info(len(visited))
+        logging.info(visited)
+    return visited
 
-def part_two(input_data: list[str], args) -> None:
+def sweep_fleets(input_data: list[str], max_deliverers: int) -> None:
     for line in input_data:
-        visited = set()
-        locations = [(0, 0), (0, 0)]
-        visited.update(locations)
-        santa = True
-        for char in line:
-            if char not in location_delta: continue
-            move = location_delta[char]
-            location = locations[0 if santa else 1]
-            newLocation = (
-                location[0] + move[0],
-                location[1] + move[1])
-            locations[0 if santa else 1] = newLocation
-            visited.add(newLocation)
-            santa = not santa
-        logging.debug(f"{line} => {visited}")
-        logging.info(len(visited))
+        # encoded once for every fleet size
+        moves = encode(line)
+        for deliverers in range(1, max_deliverers + 1):
+            logging.info(f"{deliverers} deliverers: {count_fleet(moves, deliverers)}")
 
 if __name__ == '__main__':
     parser = argparse.ArgumentParser()
@@ -63,11 +144,16 @@ if __name__ == '__main__':
     parser.add_argument('-o', '--output-file', default=None)
     parser.add_argument('-v', '--verbose', '--debug', default=False, action='store_true')
     parser.add_argument('-p', '--part', type=int, default=1)
+    parser.add_argument('--profile', default=False, action='store_true')
+    parser.add_argument('-n', '--deliverers', type=int, default=2)
+    # count every fleet size from 1 up to this one
+    parser.add_argument('--sweep', type=int, default=None)
     args = parser.parse_args()
     configure_logging(args.verbose, args.output_file)
 
     filename = args.input_file
     with open(filename) as input_file:
         input_data = [line.rstrip('\n') for line in input_file]
-    if args.part == 1: part_one(input_data, args)
-    elif args.part == 2: part_two(input_data, args)
+    if args.sweep is not None: sweep_fleets(input_data, args.sweep)
+    elif args.part == 1: profiling.run(part_one, input_data, args)
+    elif args.part == 2: profiling.run(part_two, input_data, args)
@@ -1,6 +1,13 @@
 import logging
 import argparse
 import hashlib
+import multiprocessing
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from aoc import profiling, counters, checkpoint
 
 def configure_logging(verbose, output_file):
     log_level = logging.DEBUG if verbose else logging.INFO
@@ -17,29 +24,120 @@ def configure_logging(verbose, output_file):
             filemode='w'
         )
 
-def part_one(input_value: str, args) -> None:
-    logging.info(f"Part One: {input_value}")
-    suffix = 0
+# The hashing kernel: the key is hashed once and that state copied for every suffix,
+# and leading zero nibbles are checked on the raw digest with one bytes comparison,
+# since the digest starts with n zero nibbles exactly when it's below 16 ** (32 - n).
+PROGRESS_EVERY = 1 << 20
+
+def zeros_limit(zeros: int) -> bytes:
+    return (1 << (128 - 4 * zeros)).to_bytes(16, 'big')
+
+def hash_range(key_state, limit: bytes, start: int, end: int) -> int:
+    copy = key_state.copy
+    for suffix in range(start, end):
+        hashed = copy()
+        hashed.update(b'%d' % suffix)
+        if hashed.digest() < limit: return suffix
+    return None
+
+def open_checkpoint(input_value: str, zeros: int, args) -> checkpoint.Checkpoint:
+    # the checkpoint is just the lowest suffix not yet known to miss
+    path = os.path.join(os.path.dirname(os.path.abspath(__file__)), f"zeros{zeros}.checkpoint.json")
+    return checkpoint.from_args(args, path, [input_value, zeros])
+
+def find_suffix(input_value: str, zeros: int, progress: checkpoint.Checkpoint) -> int:
+    key_state = hashlib.md5(input_value.encode(encoding='UTF-8'))
+    limit = zeros_limit(zeros)
+    saved = progress.load()
+    start = 0 if saved is None else saved['suffix']
+    first = start
     while True:
-        value = input_value + str(suffix)
-        hashed = hashlib.md5(value.encode(encoding='UTF-8')).hexdigest()
-        if hashed[:5] == '00000':
-            logging.info(f"{suffix} => {hashed}")
-            break
-        suffix += 1
+        suffix = hash_range(key_state, limit, start, start + PROGRESS_EVERY)
+        if suffix is not None:
+            # counted once here rather than on every pass of the loop
+            counters.add('hashes computed', suffix + 1 - first)
+            progress.clear()
+            return suffix
+        start += PROGRESS_EVERY
+        logging.debug(f"{start} tried")
+        if progress.due(): progress.save({ 'suffix': start })
+
 
+def part_one(input_value: str, args) -> int:
+    logging.info(f"Part One: {input_value}")
+    suffix = find_suffix(input_value, 5, open_checkpoint(input_value, 5, args))
+    logging.info(f"{suffix} => {hashlib.md5((input_value + str(suffix)).encode()).hexdigest()}")
+    return suffix
 
-def part_two(input_value: str, args) -> None:
+
+def part_two(input_value: str, args) -> int:
     logging.info(f"Part Two: {input_value}")
-    suffix = 0
-    while True:
-        value = input_value + str(suffix)
-        hashed = hashlib.md5(value.encode(encoding='UTF-8')).hexdigest()
-        if suffix % 1000000 == 0: logging.debug(f"{suffix} => {hashed}")
-        if hashed[:6] == '000000':
-            logging.info(f"{suffix} => {hashed}")
-            break
-        suffix += 1
+    suffix = find_suffix(input_value, 6, open_checkpoint(input_value, 6, args))
+    logging.info(f"{suffix} => {hashlib.md5((input_value + str(suffix)).encode()).hexdigest()}")
+    return suffix
+
+
+# Parallel search: suffixes are handed out in shards, each worker reports the lowest hit in its shard,
+# and everyone shares the best hit so far, so shards above it stop early or never start.
+# Shards below the best always finish, so the answer is still the lowest suffix overall.
+CHECK_EVERY = 1 << 12
+
+shared_best = None
+
+def init_search_worker(best) -> None:
+    global shared_best
+    shared_best = best
+
+def search_shard(input_value: str, zeros: int, start: int, end: int) -> tuple[int, int]:
+    key_state = hashlib.md5(input_value.encode(encoding='UTF-8'))
+    limit = zeros_limit(zeros)
+    for block_start in range(start, end, CHECK_EVERY):
+        if block_start > shared_best.value:
+            return (None, block_start - start)
+        suffix = hash_range(key_state, limit, block_start, min(block_start + CHECK_EVERY, end))
+        if suffix is not None:
+            with shared_best.get_lock():
+                if suffix < shared_best.value: shared_best.value = suffix
+            return (suffix, suffix - start + 1)
+    return (None, end - start)
+
+def parallel_search(input_value: str, zeros: int, workers: int, shard_size: int, progress: checkpoint.Checkpoint) -> int:
+    # a signed 64 bit 'no hit yet'
+    best = multiprocessing.Value('q', (1 << 63) - 1)
+    saved = progress.load()
+    next_start = 0 if saved is None else saved['suffix']
+    # shard start for each future, since the checkpoint is the lowest shard still out
+    pending = {}
+    with ProcessPoolExecutor(max_workers=workers, initializer=init_search_worker, initargs=(best,)) as executor:
+        while True:
+            # keep every worker busy, but stop handing out shards past the best hit
+            while len(pending) < 2 * workers and next_start <= best.value:
+                future = executor.submit(search_shard, input_value, zeros, next_start, next_start + shard_size)
+                pending[future] = next_start
+                next_start += shard_size
+            if len(pending) == 0: break
+            (done, _) = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                del pending[future]
+                (hit, hashed) = future.result()
+                counters.add('hashes computed', hashed)
+                if hit is not None: logging.debug(f"shard hit at {hit}")
+            if progress.due() and best.value > next_start:
+                progress.save({ 'suffix': min(pending.values(), default=next_start) })
+    progress.clear()
+    return best.value
+
+def part_one_parallel(input_value: str, args) -> int:
+    logging.info(f"Part One: {input_value}")
+    suffix = parallel_search(input_value, 5, args.workers, args.shard_size, open_checkpoint(input_value, 5, args))
+    logging.info(f"{suffix} => {hashlib.md5((input_value + str(suffix)).encode()).hexdigest()}")
+    return suffix
+
+def part_two_parallel(input_value: str, args) -> int:
+    logging.info(f"Part Two: {input_value}")
+    suffix = parallel_search(input_value, 6, args.workers, args.shard_size, open_checkpoint(input_value, 6, args))
+    logging.info(f"{suffix} => {hashlib.md5((input_value + str(suffix)).encode()).hexdigest()}")
+    return suffix
 
 
 if __name__ == '__main__':
@@ -48,9 +146,19 @@ if __name__ == '__main__':
     parser.add_argument('-i', '--input-value', type=str, default=None)
     parser.add_argument('-v', '--verbose', '--debug', default=False, action='store_true')
     parser.add_argument('-p', '--part', type=int, default=1)
+    parser.add_argument('--profile', default=False, action='store_true')
+    parser.add_argument('-j', '--workers', type=int, default=1)
+    parser.add_argument('-s', '--shard-size', type=int, default=1 << 18)
+    parser.add_argument('--checkpoint-file', default=None)
+    parser.add_argument('--checkpoint-interval', type=float, default=checkpoint.DEFAULT_INTERVAL)
+    parser.add_argument('--resume', default=False, action='store_true')
     args = parser.parse_args()
     configure_logging(args.verbose, args.output_file)
 
     input_value = args.input_value or 'yzbqklnj'
-    if args.part == 1: part_one(input_value, args)
-    elif args.part == 2: part_two(input_value, args)
+    if args.workers > 1:
+        if args.part == 1: profiling.run(part_one_parallel, input_value, args)
+        elif args.part == 2: profiling.run(part_two_parallel, input_value, args)
+    elif args.part == 1: profiling.run(part_one, input_value, args)
+    elif args.part == 2: profiling.run(part_two, input_value, args)
+    counters.report()
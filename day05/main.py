@@ -1,5 +1,14 @@
 import logging
 import argparse
+import os
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterable
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from aoc import inputs, profiling
 
 def configure_logging(verbose, output_file):
     log_level = logging.DEBUG if verbose else logging.INFO
@@ -16,41 +25,103 @@ def configure_logging(verbose, output_file):
             filemode='w'
         )
 
-naughty_sequences = set([ 'ab', 'cd', 'pq', 'xy'])
-vowels = 'aeiou'
+naughty_pattern = re.compile(r'ab|cd|pq|xy')
 
-def contains_naughty_sequence(value: str) -> bool:
-    return any(sequence in value for sequence in naughty_sequences)
+# Each part's rules checked with str methods and regexes, which run in C
+# and beat walking the string character by character in Python.
+double_letter_pattern = re.compile(r'(.)\1')
+# the .* means the second copy starts after the first ends, so they can't overlap
+repeated_pair_pattern = re.compile(r'(..).*\1')
+split_duplicate_pattern = re.compile(r'(.).\1')
 
-def contains_double_letters(value: str) -> bool:
-    return any(value[i] == value[i-1] for i in range(1, len(value)))
+def is_nice_one(value: str) -> bool:
+    if naughty_pattern.search(value) is not None: return False
+    if double_letter_pattern.search(value) is None: return False
+    return sum(map(value.count, 'aeiou')) >= 3
 
-def count_vowels(value: str) -> int:
-    return sum(value.count(vowel) for vowel in vowels)
+def is_nice_two(value: str) -> bool:
+    return split_duplicate_pattern.search(value) is not None and repeated_pair_pattern.search(value) is not None
 
-def part_one(input_data: list[str], args) -> None:
-    nice_strings = 0
+def classify_all(input_data: Iterable[str]) -> tuple[int, int]:
+    # nice strings by part one's rules and by part two's, from one pass over the lines
+    nice_one = 0
+    nice_two = 0
+    strings = 0
+    start = time.perf_counter()
     for line in input_data:
-        if contains_naughty_sequence(line): continue
-        if not contains_double_letters(line): continue
-        if count_vowels(line) < 3: continue
-        nice_strings += 1
-    logging.info(f"Part One: {nice_strings}")
+        nice_one += is_nice_one(line)
+        nice_two += is_nice_two(line)
+        strings += 1
+    seconds = time.perf_counter() - start
+    logging.debug(f"{strings} strings in {seconds:.3f}s, {strings / seconds if seconds > 0 else 0:.0f} strings/sec")
+    return (nice_one, nice_two)
+
+# Bulk mode for huge word lists: the file is cut into shards on line boundaries,
+# and each worker maps the file and classifies its own shard for both parts at once.
+def shard_bounds(filename: str, shard_size: int) -> list[tuple[int, int]]:
+    size = os.path.getsize(filename)
+    ends = [0]
+    with open(filename, 'rb') as input_file:
+        while ends[-1] < size:
+            # a shard runs on to the end of whatever line it would have stopped in
+            input_file.seek(ends[-1] + shard_size)
+            input_file.readline()
+            ends.append(min(input_file.tell(), size))
+    return list(zip(ends, ends[1:]))
+
+def classify_shard(filename: str, start: int, end: int) -> dict:
+    begun = time.perf_counter()
+    with inputs.open_view(filename) as view:
+        lines = str(view[start:end], 'ascii').splitlines()
+    (nice_one, nice_two) = classify_all(lines)
+    return { 'start': start, 'end': end, 'strings': len(lines), 'nice_one': nice_one, 'nice_two': nice_two,
+        'seconds': time.perf_counter() - begun }
 
+def bulk_classify(filename: str, workers: int, shard_size: int) -> tuple[int, int, list[dict]]:
+    bounds = shard_bounds(filename, shard_size)
+    starts = [start for (start, _) in bounds]
+    ends = [end for (_, end) in bounds]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        shards = list(executor.map(classify_shard, [filename] * len(bounds), starts, ends))
+    return (sum(shard['nice_one'] for shard in shards), sum(shard['nice_two'] for shard in shards), shards)
 
-def contains_repeated_pair(value: str) -> bool:
-    return any(value.count(value[i-2:i]) >= 2 for i in range(2, len(value)))
+def classify_bulk(filename: str, args) -> tuple[int, int]:
+    if args.workers > 1:
+        (nice_one, nice_two, shards) = bulk_classify(filename, args.workers, args.shard_size)
+        if args.shard_stats:
+            for shard in shards:
+                strings_per_second = shard['strings'] / shard['seconds'] if shard['seconds'] > 0 else 0
+                logging.info(f"Bytes {shard['start']}-{shard['end']}: {shard['strings']} strings, "
+                    f"{shard['nice_one']}/{shard['nice_two']} nice, {shard['seconds']:.3f}s ({strings_per_second:.0f} strings/sec)")
+    else:
+        # one core gains nothing from shards, so the file streams through the same pass
+        (nice_one, nice_two) = classify_all(inputs.iter_lines(filename))
+    logging.info(f"Part One: {nice_one}")
+    logging.info(f"Part Two: {nice_two}")
+    return (nice_one, nice_two)
 
-def contains_split_duplicate(value: str) -> bool:
-    return any(value[i-2] == value[i] for i in range(2, len(value)))
 
-def part_two(input_data: list[str], args) -> None:
+def count_nice(input_data: Iterable[str], is_nice) -> int:
     nice_strings = 0
+    strings = 0
+    start = time.perf_counter()
     for line in input_data:
-        if not contains_repeated_pair(line): continue
-        if not contains_split_duplicate(line): continue
-        nice_strings += 1
+        nice_strings += is_nice(line)
+        strings += 1
+    seconds = time.perf_counter() - start
+    logging.debug(f"{strings} strings in {seconds:.3f}s, {strings / seconds if seconds > 0 else 0:.0f} strings/sec")
+    return nice_strings
+
+def part_one(input_data: Iterable[str], args) -> int:
+    nice_strings = count_nice(input_data, is_nice_one)
+    logging.info(f"Part One: {nice_strings}")
+    return nice_strings
+
+
+def part_two(input_data: Iterable[str], args) -> int:
+    nice_strings = count_nice(input_data, is_nice_two)
     logging.info(f"Part Two: {nice_strings}")
+    return nice_strings
 
 
 if __name__ == '__main__':
@@ -59,11 +130,20 @@ if __name__ == '__main__':
     parser.add_argument('-o', '--output-file', default=None)
     parser.add_argument('-v', '--verbose', '--debug', default=False, action='store_true')
     parser.add_argument('-p', '--part', type=int, default=1)
+    parser.add_argument('--profile', default=False, action='store_true')
+    parser.add_argument('-j', '--workers', type=int, default=1)
+    parser.add_argument('-s', '--shard-size', type=int, default=1 << 24)
+    parser.add_argument('--shard-stats', default=False, action='store_true')
+    parser.add_argument('--both', default=False, action='store_true')
     args = parser.parse_args()
     configure_logging(args.verbose, args.output_file)
 
     filename = args.input_file
-    with open(filename) as input_file:
-        input_data = [line.rstrip('\n') for line in input_file]
-    if args.part == 1: part_one(input_data, args)
-    elif args.part == 2: part_two(input_data, args)
+    if args.workers > 1 or args.both:
+        # both parts come out of the one pass
+        profiling.run(classify_bulk, filename, args)
+        exit(0)
+    # these parts only scan once, so there's no need to hold the whole file
+    input_data = inputs.iter_lines(filename)
+    if args.part == 1: profiling.run(part_one, input_data, args)
+    elif args.part == 2: profiling.run(part_two, input_data, args)
@@ -1,7 +1,22 @@
 import logging
 import argparse
 import re
+import os
+import sys
+import zlib
+from array import array
+from bisect import bisect_left
 from collections import defaultdict
+from itertools import chain, compress
+from operator import mul
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from aoc import profiling
 
 def configure_logging(verbose, output_file):
     log_level = logging.DEBUG if verbose else logging.INFO
@@ -45,36 +60,238 @@ actions = {
     'toggle': (toggle, double_increase_brightness)
 }
 
-def part_one(input_data: list[str], args) -> None:
+def parse_instructions(input_data: list[str]) -> list[tuple[str, int, int, int, int]]:
     line_pattern = re.compile('(.+) (\d+),(\d+) through (\d+),(\d+)')
-    lit_lights = set()
+    instructions = []
     for line in input_data:
         m = line_pattern.match(line)
-        action = actions[m.group(1)][0]
-        start_x = int(m.group(2))
-        start_y = int(m.group(3))
-        end_x = int(m.group(4))
-        end_y = int(m.group(5))
-        for x in range(start_x, end_x+1):
-            for y in range(start_y, end_y+1):
-                action((x, y), lit_lights)
-    logging.info(f"Part One: {len(lit_lights)}")
+        instructions.append((m.group(1), int(m.group(2)), int(m.group(3)), int(m.group(4)), int(m.group(5))))
+    return instructions
 
 
-def part_two(input_data: list[str], args) -> None:
-    line_pattern = re.compile('(.+) (\d+),(\d+) through (\d+),(\d+)')
-    lights = defaultdict(int)
-    for line in input_data:
-        m = line_pattern.match(line)
-        action = actions[m.group(1)][1]
-        start_x = int(m.group(2))
-        start_y = int(m.group(3))
-        end_x = int(m.group(4))
-        end_y = int(m.group(5))
+# The engines all take the instructions, the grid size,
+# and which of each action pair to use: 0 for lit or not, 1 for brightness.
+
+def light_cells(instructions: list[tuple[str, int, int, int, int]], grid_size: int, mode: int) -> int:
+    # one call per light, as it always was
+    lights = set() if mode == 0 else defaultdict(int)
+    for (name, start_x, start_y, end_x, end_y) in instructions:
+        action = actions[name][mode]
         for x in range(start_x, end_x+1):
             for y in range(start_y, end_y+1):
                 action((x, y), lights)
-    logging.info(f"Part Two: {sum(lights.values())}")
+    return len(lights) if mode == 0 else sum(lights.values())
+
+
+# Grid engine: the lights are one 2-D array and each instruction is a single operation on a slice of it.
+# With NumPy that's a bool array for lit and an int one for brightness;
+# without, it's a bytearray per row for lit, flipped with translate(), and a list per row for brightness.
+
+def region_turn_on(region) -> None:
+    region[...] = True
+
+def region_turn_off(region) -> None:
+    region[...] = False
+
+def region_toggle(region) -> None:
+    region ^= True
+
+def region_increase_brightness(region) -> None:
+    region += 1
+
+def region_decrease_brightness(region) -> None:
+    # only the lit ones go down, so nothing drops below 0
+    region -= region > 0
+
+def region_double_increase_brightness(region) -> None:
+    region += 2
+
+region_actions = {
+    'turn on': (region_turn_on, region_increase_brightness),
+    'turn off': (region_turn_off, region_decrease_brightness),
+    'toggle': (region_toggle, region_double_increase_brightness)
+}
+
+toggle_bytes = bytes.maketrans(b'\x00\x01', b'\x01\x00')
+
+def row_turn_on(row: bytearray, start: int, end: int) -> None:
+    row[start:end] = b'\x01' * (end - start)
+
+def row_turn_off(row: bytearray, start: int, end: int) -> None:
+    row[start:end] = bytes(end - start)
+
+def row_toggle(row: bytearray, start: int, end: int) -> None:
+    row[start:end] = row[start:end].translate(toggle_bytes)
+
+def row_increase_brightness(row: list[int], start: int, end: int) -> None:
+    row[start:end] = [value + 1 for value in row[start:end]]
+
+def row_decrease_brightness(row: list[int], start: int, end: int) -> None:
+    row[start:end] = [value - 1 if value > 0 else 0 for value in row[start:end]]
+
+def row_double_increase_brightness(row: list[int], start: int, end: int) -> None:
+    row[start:end] = [value + 2 for value in row[start:end]]
+
+row_actions = {
+    'turn on': (row_turn_on, row_increase_brightness),
+    'turn off': (row_turn_off, row_decrease_brightness),
+    'toggle': (row_toggle, row_double_increase_brightness)
+}
+
+def new_grid(width: int, height: int, mode: int):
+    if np is not None: return np.zeros((width, height), dtype=bool if mode == 0 else np.int32)
+    if mode == 0: return [bytearray(height) for _ in range(width)]
+    return [[0] * height for _ in range(width)]
+
+def apply_instructions(grid, instructions: list[tuple[str, int, int, int, int]], mode: int) -> None:
+    if np is not None:
+        for (name, start_x, start_y, end_x, end_y) in instructions:
+            region_actions[name][mode](grid[start_x:end_x+1, start_y:end_y+1])
+        return
+    for (name, start_x, start_y, end_x, end_y) in instructions:
+        action = row_actions[name][mode]
+        for x in range(start_x, end_x+1):
+            action(grid[x], start_y, end_y+1)
+
+def build_grid(instructions: list[tuple[str, int, int, int, int]], width: int, height: int, mode: int):
+    grid = new_grid(width, height, mode)
+    apply_instructions(grid, instructions, mode)
+    return grid
+
+def count_region(grid, mode: int, start_x: int, start_y: int, end_x: int, end_y: int) -> int:
+    # lights lit, or total brightness, in the rectangle
+    if np is not None:
+        region = grid[start_x:end_x+1, start_y:end_y+1]
+        return int(np.count_nonzero(region)) if mode == 0 else int(region.sum(dtype=np.int64))
+    rows = grid[start_x:end_x+1]
+    if mode == 0: return sum(row[start_y:end_y+1].count(1) for row in rows)
+    return sum(sum(row[start_y:end_y+1]) for row in rows)
+
+def light_grid(instructions: list[tuple[str, int, int, int, int]], grid_size: int, mode: int) -> int:
+    grid = build_grid(instructions, grid_size, grid_size, mode)
+    return count_region(grid, mode, 0, 0, grid_size - 1, grid_size - 1)
+
+
+# History of the grid, for questions about the lights part way through the instructions.
+# Instructions are applied one at a time and every so often the whole grid is stored, zlib-compressed.
+# The state after any number of instructions is then the nearest snapshot at or before it,
+# with the few instructions since replayed on top.
+SNAPSHOT_EVERY = 64
+
+def pack_grid(grid, mode: int) -> bytes:
+    if np is not None: return zlib.compress(grid.tobytes(), 1)
+    if mode == 0: return zlib.compress(b''.join(grid), 1)
+    return zlib.compress(array('i', chain.from_iterable(grid)).tobytes(), 1)
+
+def unpack_grid(packed: bytes, width: int, height: int, mode: int):
+    data = zlib.decompress(packed)
+    if np is not None:
+        # frombuffer is read-only, and the replay needs to write to it
+        return np.frombuffer(data, dtype=bool if mode == 0 else np.int32).reshape(width, height).copy()
+    if mode == 0: return [bytearray(data[x*height:(x+1)*height]) for x in range(width)]
+    values = array('i')
+    values.frombytes(data)
+    return [values[x*height:(x+1)*height].tolist() for x in range(width)]
+
+class LightHistory:
+    def __init__(self, grid_size: int, mode: int, snapshot_every: int = SNAPSHOT_EVERY):
+        self.grid_size = grid_size
+        self.mode = mode
+        self.snapshot_every = snapshot_every
+        self.instructions = []
+        self.grid = new_grid(grid_size, grid_size, mode)
+        self.snapshots = [pack_grid(self.grid, mode)]
+        # the last state replayed, since queries often come in order
+        self.replayed = None
+
+    def add(self, instruction: tuple[str, int, int, int, int]) -> None:
+        self.instructions.append(instruction)
+        apply_instructions(self.grid, [instruction], self.mode)
+        if len(self.instructions) % self.snapshot_every == 0:
+            self.snapshots.append(pack_grid(self.grid, self.mode))
+
+    def state_at(self, k: int):
+        # the grid after the first k instructions; don't change it
+        if k == len(self.instructions): return self.grid
+        if not 0 <= k <= len(self.instructions): raise IndexError(f"instruction {k} of {len(self.instructions)}")
+        snapshot = k // self.snapshot_every
+        start = snapshot * self.snapshot_every
+        if self.replayed is not None and start <= self.replayed[0] <= k:
+            (start, grid) = self.replayed
+        else:
+            grid = unpack_grid(self.snapshots[snapshot], self.grid_size, self.grid_size, self.mode)
+        apply_instructions(grid, self.instructions[start:k], self.mode)
+        self.replayed = (k, grid)
+        return grid
+
+    def total(self, k: int) -> int:
+        # lights lit, or total brightness, after k instructions
+        return count_region(self.state_at(k), self.mode, 0, 0, self.grid_size - 1, self.grid_size - 1)
+
+    def region(self, k: int, start_x: int, start_y: int, end_x: int, end_y: int) -> int:
+        return count_region(self.state_at(k), self.mode, start_x, start_y, end_x, end_y)
+
+
+def query_history(input_data: list[str], args) -> list[int]:
+    history = LightHistory(args.grid_size, args.part - 1, args.snapshot_every)
+    for instruction in parse_instructions(input_data):
+        history.add(instruction)
+    results = []
+    for k in args.at:
+        if args.region is None: result = history.total(k)
+        else: result = history.region(k, *args.region)
+        logging.info(f"After {k} instructions: {result}")
+        results.append(result)
+    return results
+
+
+# Compressed engine, for grids too big to hold: every light between two consecutive rectangle edges
+# is treated exactly the same by every instruction, so each such block becomes a single cell.
+# The grid engine runs on the blocks, and each block counts for its width times its height,
+# so the work depends on the number of instructions rather than the size of the grid.
+# Lights outside every rectangle stay off, so the grid size doesn't matter at all.
+
+def compress_instructions(instructions: list[tuple[str, int, int, int, int]]):
+    # (instructions in block coordinates, block widths, block heights)
+    edges_x = sorted(set([start_x for (_, start_x, _, _, _) in instructions] + [end_x + 1 for (_, _, _, end_x, _) in instructions]))
+    edges_y = sorted(set([start_y for (_, _, start_y, _, _) in instructions] + [end_y + 1 for (_, _, _, _, end_y) in instructions]))
+    compressed = []
+    for (name, start_x, start_y, end_x, end_y) in instructions:
+        # a rectangle covers the blocks from its start edge up to, but not including, its end edge
+        compressed.append((name, bisect_left(edges_x, start_x), bisect_left(edges_y, start_y),
+            bisect_left(edges_x, end_x + 1) - 1, bisect_left(edges_y, end_y + 1) - 1))
+    widths = [b - a for (a, b) in zip(edges_x, edges_x[1:])]
+    heights = [b - a for (a, b) in zip(edges_y, edges_y[1:])]
+    return (compressed, widths, heights)
+
+def light_compressed(instructions: list[tuple[str, int, int, int, int]], grid_size: int, mode: int) -> int:
+    if len(instructions) == 0: return 0
+    (compressed, widths, heights) = compress_instructions(instructions)
+    grid = build_grid(compressed, len(widths), len(heights), mode)
+    if np is not None:
+        # a 10^6 x 10^6 block is already 10^12 lights, so weight in int64
+        areas = np.outer(np.array(widths, dtype=np.int64), np.array(heights, dtype=np.int64))
+        return int((areas * grid).sum())
+    if mode == 0: return sum(width * sum(compress(heights, row)) for (width, row) in zip(widths, grid))
+    return sum(width * sum(map(mul, heights, row)) for (width, row) in zip(widths, grid))
+
+
+engines = {
+    'cells': light_cells,
+    'grid': light_grid,
+    'compressed': light_compressed,
+}
+
+def part_one(input_data: list[str], args) -> int:
+    lit_lights = engines[args.engine](parse_instructions(input_data), args.grid_size, 0)
+    logging.info(f"Part One: {lit_lights}")
+    return lit_lights
+
+
+def part_two(input_data: list[str], args) -> int:
+    total_brightness = engines[args.engine](parse_instructions(input_data), args.grid_size, 1)
+    logging.info(f"Part Two: {total_brightness}")
+    return total_brightness
 
 
 if __name__ == '__main__':
@@ -83,11 +300,20 @@ if __name__ == '__main__':
     parser.add_argument('-o', '--output-file', default=None)
     parser.add_argument('-v', '--verbose', '--debug', default=False, action='store_true')
     parser.add_argument('-p', '--part', type=int, default=1)
+    parser.add_argument('--profile', default=False, action='store_true')
+    parser.add_argument('-e', '--engine', choices=list(engines), default='grid')
+    parser.add_argument('-g', '--grid-size', type=int, default=1000)
+    # lit count (part 1) or brightness (part 2) after each of these numbers of instructions
+    parser.add_argument('--at', type=int, nargs='+', default=None)
+    # only count inside start_x,start_y,end_x,end_y
+    parser.add_argument('--region', type=lambda r: [int(c) for c in r.split(',')], default=None)
+    parser.add_argument('--snapshot-every', type=int, default=SNAPSHOT_EVERY)
     args = parser.parse_args()
     configure_logging(args.verbose, args.output_file)
 
     filename = args.input_file
     with open(filename) as input_file:
         input_data = [line.rstrip('\n') for line in input_file]
-    if args.part == 1: part_one(input_data, args)
-    elif args.part == 2: part_two(input_data, args)
+    if args.at is not None: profiling.run(query_history, input_data, args)
+    elif args.part == 1: profiling.run(part_one, input_data, args)
+    elif args.part == 2: profiling.run(part_two, input_data, args)
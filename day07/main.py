@@ -1,9 +1,15 @@
 import logging
 import argparse
+import operator
+import os
 import re
+import sys
 from typing import Callable
 from collections import deque
 
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from aoc import tracing, profiling, counters
+
 def configure_logging(verbose, output_file):
     log_level = logging.DEBUG if verbose else logging.INFO
     if output_file is None:
@@ -44,38 +50,38 @@ def is_value_input(inputs: list[str]) -> bool:
 
 def operation_value(values: list[int]) -> int:
     value = values[0]
-    logging.debug(f"VALUE: {value}")
+    if tracing.enabled: tracing.event("VALUE: %s", value)
     return value
 
 def operation_not(values: list[int]) -> int:
     # I could format the input to 16 bits, then NOT the whole thing: '{0:016b}'.format(value)
     # or I can subtract the input from 2^16-1 and get the same answer
     value = MAX_VALUE - values[0]
-    logging.debug(f"NOT {values[0]}: {value}")
+    if tracing.enabled: tracing.event("NOT %s: %s", values[0], value)
     return value
 
 def operation_lshift(bitcount: int) -> int:
     def apply(values: list[int]) -> int:
         value = values[0] << bitcount
-        logging.debug(f"{values[0]} LSHIFT {bitcount}: {value}")
+        if tracing.enabled: tracing.event("%s LSHIFT %s: %s", values[0], bitcount, value)
         return value
     return apply
 
 def operation_rshift(bitcount: int) -> int:
     def apply(values: list[int]) -> int:
         value = values[0] >> bitcount
-        logging.debug(f"{values[0]} RSHIFT {bitcount}: {value}")
+        if tracing.enabled: tracing.event("%s RSHIFT %s: %s", values[0], bitcount, value)
         return value
     return apply
 
 def operation_or(values: list[int]) -> int:
     value = values[0] | values[1]
-    logging.debug(f"{values[0]} OR {values[1]}: {value}")
+    if tracing.enabled: tracing.event("%s OR %s: %s", values[0], values[1], value)
     return value
 
 def operation_and(values: list[int]) -> int:
     value = values[0] & values[1]
-    logging.debug(f"{values[0]} AND {values[1]}: {value}")
+    if tracing.enabled: tracing.event("%s AND %s: %s", values[0], values[1], value)
     return value
 
 def parse_inputs(inputs: list[str]) -> tuple[Callable, list[str]]:
@@ -98,7 +104,7 @@ def parse_inputs(inputs: list[str]) -> tuple[Callable, list[str]]:
     return (operation_and, [inputs[0], inputs[2]])
 
 
-def part_one(input_data: list[str], args) -> dict[str, int]:
+def connect_wires_queued(input_data: list[str]) -> dict[str, int]:
     wires = {} # name:str = value:int
     operations = deque()
     line_pattern = re.compile('(.+) -> (.+)$')
@@ -108,7 +114,7 @@ def part_one(input_data: list[str], args) -> dict[str, int]:
         output_wire = m.group(2)
         if is_value_input(inputs):
             wires[output_wire] = int(inputs[0])
-            logging.debug(f"{output_wire} = {wires[output_wire]}")
+            if tracing.enabled: tracing.event("%s = %s", output_wire, wires[output_wire])
         else:
             (operation, input_wires) = parse_inputs(inputs)
             operations.append(Operation(input_wires, output_wire, operation))
@@ -117,24 +123,117 @@ def part_one(input_data: list[str], args) -> dict[str, int]:
         if not operation.is_ready(wires):
             # to the back of the queue
             operations.append(operation)
+            counters.add('requeues')
             continue
         inputs = [int(wire) if wire.isdigit() else wires[wire] for wire in operation.input_wires]
         # some might exceed max value, so truncate them to just the 16 bits we can use
         value = operation.operate(inputs) & MAX_VALUE
         wires[operation.output_wire] = value
-        logging.debug(f"{operation} = {value}")
-    logging.debug(wires)
-    logging.info(f"Part One: {wires.get('a')}")
+        counters.add('gates evaluated')
+        if tracing.enabled: tracing.event("%s = %s", operation, value)
+    if tracing.enabled: tracing.event("%s", wires)
+    return wires
+
+
+# Compiled circuit: every gate becomes one step of a flat program over numbered slots,
+# in an order where each gate comes after the gates feeding it (Kahn's algorithm),
+# so running it is a single pass with no readiness checks.
+# Every step is (op, output slot, input slot, input slot) with op a two-input operator;
+# literal inputs get slots of their own, and the one-input gates borrow a constant:
+# a plain wire is 'OR 0' and NOT is 'XOR 65535'.
+gate_operators = {
+    'AND': operator.and_,
+    'OR': operator.or_,
+    'LSHIFT': operator.lshift,
+    'RSHIFT': operator.rshift,
+}
+
+def parse_gate(inputs: list[str]) -> tuple[Callable, str, str]:
+    # {wire or value}
+    if len(inputs) == 1: return (operator.or_, inputs[0], '0')
+    # NOT {wire}
+    if len(inputs) == 2: return (operator.xor, inputs[1], str(MAX_VALUE))
+    # {wire} AND|OR|LSHIFT|RSHIFT {wire or value}
+    return (gate_operators[inputs[1]], inputs[0], inputs[2])
+
+def compile_circuit(input_data: list[str]) -> tuple[list[tuple[Callable, int, int, int]], list[int], dict[str, int]]:
+    # (program, starting slot values, slot for each wire)
+    line_pattern = re.compile('(.+) -> (.+)$')
+    slots = {}
+    values = []
+    def slot(name: str) -> int:
+        if name not in slots:
+            slots[name] = len(values)
+            # a literal's slot just holds the literal
+            values.append(int(name) if name.isdigit() else 0)
+        return slots[name]
+
+    gates = []
+    for line in input_data:
+        m = line_pattern.match(line)
+        (op, left, right) = parse_gate(m.group(1).split())
+        gates.append((op, m.group(2), left, right))
+
+    # waiting[gate] = how many of its inputs are wires that haven't been computed yet
+    waiting = [0] * len(gates)
+    feeds = {} # wire:str = gates that read it
+    for (index, (_, _, left, right)) in enumerate(gates):
+        for wire in (left, right):
+            if wire.isdigit(): continue
+            waiting[index] += 1
+            feeds.setdefault(wire, []).append(index)
+    ready = deque(index for index in range(len(gates)) if waiting[index] == 0)
+    program = []
+    while len(ready) > 0:
+        (op, output_wire, left, right) = gates[ready.popleft()]
+        program.append((op, slot(output_wire), slot(left), slot(right)))
+        for index in feeds.get(output_wire, []):
+            waiting[index] -= 1
+            if waiting[index] == 0: ready.append(index)
+    if len(program) < len(gates):
+        raise ValueError(f"{len(gates) - len(program)} gates have an input that's never driven, or a loop")
+    return (program, values, slots)
+
+def run_program(program: list[tuple[Callable, int, int, int]], values: list[int]) -> list[int]:
+    values = list(values)
+    for (op, output, left, right) in program:
+        # some might exceed max value, so truncate them to just the 16 bits we can use
+        values[output] = op(values[left], values[right]) & MAX_VALUE
+    return values
+
+def connect_wires(input_data: list[str]) -> dict[str, int]:
+    (program, values, slots) = compile_circuit(input_data)
+    values = run_program(program, values)
+    counters.add('gates evaluated', len(program))
+    wires = { name: values[index] for (name, index) in slots.items() if not name.isdigit() }
+    if tracing.enabled:
+        # slots were handed out in order, so the names line up with them
+        names = list(slots)
+        for (op, output, left, right) in program:
+            tracing.event("%s %s %s: %s = %s", names[left], op.__name__, names[right], names[output], values[output])
+        tracing.event("%s", wires)
     return wires
 
 
+engines = {
+    'compiled': connect_wires,
+    'queued': connect_wires_queued,
+}
+
+def part_one(input_data: list[str], args) -> int:
+    wires = engines[args.engine](input_data)
+    logging.info(f"Part One: {wires.get('a')}")
+    return wires.get('a')
+
+
 # take the value that part one gave for wire a
 # and feed it into wire b
 # then run everything again and see what the new output on wire a is
 # easiest way is to make a second input file with just the value going into b changed, right?
-def part_two(input_data: list[str], args) -> None:
-    wires = part_one(input_data, args)
+def part_two(input_data: list[str], args) -> int:
+    wires = engines[args.engine](input_data)
     logging.info(f"Part Two: {wires.get('a')}")
+    return wires.get('a')
 
 
 if __name__ == '__main__':
@@ -143,11 +242,15 @@ if __name__ == '__main__':
     parser.add_argument('-o', '--output-file', default=None)
     parser.add_argument('-v', '--verbose', '--debug', default=False, action='store_true')
     parser.add_argument('-p', '--part', type=int, default=1)
+    parser.add_argument('--profile', default=False, action='store_true')
+    parser.add_argument('-e', '--engine', choices=list(engines), default='compiled')
     args = parser.parse_args()
     configure_logging(args.verbose, args.output_file)
+    if args.verbose: tracing.enable()
 
     filename = args.input_file
     with open(filename) as input_file:
         input_data = [line.rstrip('\n') for line in input_file]
-    if args.part == 1: part_one(input_data, args)
-    elif args.part == 2: part_two(input_data, args)
+    if args.part == 1: profiling.run(part_one, input_data, args)
+    elif args.part == 2: profiling.run(part_two, input_data, args)
+    counters.report()
@@ -1,6 +1,12 @@
 import logging
 import argparse
+import os
 import re
+import sys
+from typing import Iterable
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from aoc import inputs, profiling
 
 def configure_logging(verbose, output_file):
     log_level = logging.DEBUG if verbose else logging.INFO
@@ -40,7 +46,7 @@ def length_without_specials(value: str) -> int:
 #  \" = double quote
 #  \x plus two hexadecimal characters = ASCII code for a single character
 # eg: "aaa\"aaa\x27" is 14 code, 8 memory: aaa"aaa'
-def part_one(input_data: list[str], args) -> None:
+def part_one(input_data: Iterable[str], args) -> int:
     total_code_length = 0
     total_memory_length = 0
     for line in input_data:
@@ -51,16 +57,18 @@ def part_one(input_data: list[str], args) -> None:
         total_memory_length += memory_length
     delta = total_code_length - total_memory_length
     logging.info(f"Part One: {total_code_length} - {total_memory_length} = {delta}")
+    return delta
 
 
 # encode each code representation as a new string
 # find the total number of characters to represent the newly encoded strings
 # minus the number of characters of code in each original string literal
 # "aaa\"aaa\x27" => "\"aaa\\\"aaa\\x27\""
-def part_two(input_data: list[str], args) -> None:
+def part_two(input_data: Iterable[str], args) -> int:
     # add 1 '\' for each " and each \, and wrap in new ""
     characters_added = sum(2 + line.count('"') + line.count('\\') for line in input_data)
     logging.info(f"Part Two: {characters_added}")
+    return characters_added
 
 
 if __name__ == '__main__':
@@ -69,11 +77,12 @@ if __name__ == '__main__':
     parser.add_argument('-o', '--output-file', default=None)
     parser.add_argument('-v', '--verbose', '--debug', default=False, action='store_true')
     parser.add_argument('-p', '--part', type=int, default=1)
+    parser.add_argument('--profile', default=False, action='store_true')
     args = parser.parse_args()
     configure_logging(args.verbose, args.output_file)
 
     filename = args.input_file
-    with open(filename) as input_file:
-        input_data = [line.rstrip('\n') for line in input_file]
-    if args.part == 1: part_one(input_data, args)
-    elif args.part == 2: part_two(input_data, args)
+    # these parts only scan once, so there's no need to hold the whole file
+    input_data = inputs.iter_lines(filename)
+    if args.part == 1: profiling.run(part_one, input_data, args)
+    elif args.part == 2: profiling.run(part_two, input_data, args)
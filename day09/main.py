@@ -1,7 +1,12 @@
 import logging
 import argparse
+import os
+import sys
 from collections import defaultdict, deque
 
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from aoc import profiling, counters
+
 def configure_logging(verbose, output_file):
     log_level = logging.DEBUG if verbose else logging.INFO
     if output_file is None:
@@ -71,7 +76,9 @@ def find_best_path(
     best = { 'path': None, 'distance': None }
     while len(paths) > 0:
         path = paths.popleft()
+        counters.add('paths popped')
         if should_prune_func(best['distance'], path['distance']):
+            counters.add('paths pruned')
             continue
         if len(path['remaining']) == 0:
             if is_better_func(path['distance'], best['distance']):
@@ -83,17 +90,19 @@ def find_best_path(
 
 # What's the shortest distance you can travel to visit each destination exactly once?
 # You can start and end wherever you want.
-def part_one(input_data: list[str], args) -> None:
+def part_one(input_data: list[str], args) -> int:
     destination_distances = parse_input(input_data)
     shortest = find_best_path(destination_distances, current_too_high, is_current_lower)
     logging.info(f"Part One: {shortest['distance']} via path {shortest['path']}")
+    return shortest['distance']
 
 
 # To show off, Santa wants the longest route instead.
-def part_two(input_data: list[str], args) -> None:
+def part_two(input_data: list[str], args) -> int:
     destination_distances = parse_input(input_data)
     longest = find_best_path(destination_distances, current_too_low, is_current_higher)
     logging.info(f"Part Two: {longest['distance']} via path {longest['path']}")
+    return longest['distance']
 
 
 if __name__ == '__main__':
@@ -102,11 +111,13 @@ if __name__ == '__main__':
     parser.add_argument('-o', '--output-file', default=None)
     parser.add_argument('-v', '--verbose', '--debug', default=False, action='store_true')
     parser.add_argument('-p', '--part', type=int, default=1)
+    parser.add_argument('--profile', default=False, action='store_true')
     args = parser.parse_args()
     configure_logging(args.verbose, args.output_file)
 
     filename = args.input_file
     with open(filename) as input_file:
         input_data = [line.rstrip('\n') for line in input_file]
-    if args.part == 1: part_one(input_data, args)
-    elif args.part == 2: part_two(input_data, args)
+    if args.part == 1: profiling.run(part_one, input_data, args)
+    elif args.part == 2: profiling.run(part_two, input_data, args)
+    counters.report()
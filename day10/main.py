@@ -1,5 +1,10 @@
 import logging
 import argparse
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from aoc import profiling
 
 def configure_logging(verbose, output_file):
     log_level = logging.DEBUG if verbose else logging.INFO
@@ -39,16 +44,18 @@ def flatten(data: list[tuple[int, str]]) -> list[tuple[int, str]]:
 # 21 -> 1211
 # 1211 -> 111221
 # 111221 -> 312211
-def part_one(input_data: list[str], args) -> None:
+def part_one(input_data: list[str], args) -> int:
     data = input_data[0]
     for _ in range(args.rounds):
         data = count_characters(data)
         data = merge_adjacent(data)
         data = flatten(data)
     logging.info(f"Part One: {len(data)}")
+    return len(data)
 
-def part_two(input_data: list[str], args) -> None:
+def part_two(input_data: list[str], args) -> int:
     logging.info(f"Part Two is just more rounds of part 1")
+    return part_one(input_data, args)
 
 
 if __name__ == '__main__':
@@ -57,6 +64,7 @@ if __name__ == '__main__':
     parser.add_argument('-o', '--output-file', default=None)
     parser.add_argument('-v', '--verbose', '--debug', default=False, action='store_true')
     parser.add_argument('-p', '--part', type=int, default=1)
+    parser.add_argument('--profile', default=False, action='store_true')
     parser.add_argument('-r', '--rounds', type=int, required=True)
     args = parser.parse_args()
     configure_logging(args.verbose, args.output_file)
@@ -64,5 +72,5 @@ if __name__ == '__main__':
     filename = args.input_file
     with open(filename) as input_file:
         input_data = [line.rstrip('\n') for line in input_file]
-    if args.part == 1: part_one(input_data, args)
-    elif args.part == 2: part_two(input_data, args)
+    if args.part == 1: profiling.run(part_one, input_data, args)
+    elif args.part == 2: profiling.run(part_two, input_data, args)
@@ -1,6 +1,11 @@
 import logging
 import argparse
 import re
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from aoc import profiling
 
 def configure_logging(verbose, output_file):
     log_level = logging.DEBUG if verbose else logging.INFO
@@ -72,10 +77,11 @@ def part_one(input_data: list[str], args) -> list[str]:
 
 
 # Santa's password expired again. What's the next one?
-def part_two(input_data: list[str], args) -> None:
+def part_two(input_data: list[str], args) -> list[str]:
     next_password = part_one(input_data, args)
     next_next_password = part_one(next_password, args)
     logging.info(f"Part Two: {next_next_password}")
+    return next_next_password
 
 
 if __name__ == '__main__':
@@ -84,11 +90,12 @@ if __name__ == '__main__':
     parser.add_argument('-o', '--output-file', default=None)
     parser.add_argument('-v', '--verbose', '--debug', default=False, action='store_true')
     parser.add_argument('-p', '--part', type=int, default=1)
+    parser.add_argument('--profile', default=False, action='store_true')
     args = parser.parse_args()
     configure_logging(args.verbose, args.output_file)
 
     filename = args.input_file
     with open(filename) as input_file:
         input_data = [line.rstrip('\n') for line in input_file]
-    if args.part == 1: part_one(input_data, args)
-    elif args.part == 2: part_two(input_data, args)
+    if args.part == 1: profiling.run(part_one, input_data, args)
+    elif args.part == 2: profiling.run(part_two, input_data, args)
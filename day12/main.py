@@ -1,6 +1,11 @@
 import logging
 import argparse
 import json
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from aoc import tracing, profiling
 
 def configure_logging(verbose, output_file):
     log_level = logging.DEBUG if verbose else logging.INFO
@@ -21,14 +26,14 @@ def configure_logging(verbose, output_file):
 def parse_value(value, level: int) -> int:
     if type(value) is dict:
         total = add_numbers(value, level+1)
-        logging.debug(f"{level}: {value} => {total}")
+        if tracing.enabled: tracing.event("%s: %s => %s", level, value, total)
         return total
     if type(value) is int:
-        logging.debug(f"{level}: {value} => {value}")
+        if tracing.enabled: tracing.event("%s: %s => %s", level, value, value)
         return value
     if type(value) is list:
         total = sum(parse_value(item, level) for item in value)
-        logging.debug(f"{level}: {value} => {total}")
+        if tracing.enabled: tracing.event("%s: %s => %s", level, value, total)
         return total
     return 0
 
@@ -37,14 +42,14 @@ def add_numbers(data: dict, level: int) -> int:
     total = 0
     for value in data.values():
         if value == 'red':
-            logging.debug('red')
+            if tracing.enabled: tracing.event('red')
             return 0
         total += parse_value(value, level)
-    logging.debug(f"{level}: {data}\n =>{total}")
+    if tracing.enabled: tracing.event("%s: %s\n =>%s", level, data, total)
     return total
 
 
-def part_one(input_data: list[str], args) -> None:
+def part_one(input_data: list[str], args) -> int:
     total = 0
     value = ''
     for line in input_data:
@@ -55,12 +60,14 @@ def part_one(input_data: list[str], args) -> None:
                 total += int(value)
                 value = ''
     logging.info(f"Part One: {total}")
+    return total
 
 
-def part_two(input_data: list[str], args) -> None:
+def part_two(input_data: list[str], args) -> int:
     data = json.loads(input_data[0])
     total = parse_value(data, 0)
     logging.info(f"Part Two: {total}")
+    return total
 
 
 if __name__ == '__main__':
@@ -69,11 +76,13 @@ if __name__ == '__main__':
     parser.add_argument('-o', '--output-file', default=None)
     parser.add_argument('-v', '--verbose', '--debug', default=False, action='store_true')
     parser.add_argument('-p', '--part', type=int, default=1)
+    parser.add_argument('--profile', default=False, action='store_true')
     args = parser.parse_args()
     configure_logging(args.verbose, args.output_file)
+    if args.verbose: tracing.enable()
 
     filename = args.input_file
     with open(filename) as input_file:
         input_data = [line.rstrip('\n') for line in input_file]
-    if args.part == 1: part_one(input_data, args)
-    elif args.part == 2: part_two(input_data, args)
+    if args.part == 1: profiling.run(part_one, input_data, args)
+    elif args.part == 2: profiling.run(part_two, input_data, args)
@@ -1,8 +1,13 @@
 import logging
 import argparse
 import itertools
+import os
+import sys
 from collections import defaultdict
 
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from aoc import profiling
+
 def configure_logging(verbose, output_file):
     log_level = logging.DEBUG if verbose else logging.INFO
     if output_file is None:
@@ -66,16 +71,17 @@ def find_happiest_arrangement(people, happiness_pairs):
 # => AliceBob, BobCarol, ...
 # because this is a circle, ABCD is the same as BCDA, CDAB, and DABC
 # plus we can go around in either direction so ^ also matches ADCB, DCBA, etc
-def part_one(input_data: list[str], args) -> None:
+def part_one(input_data: list[str], args) -> int:
     (people, happiness_pairs) = unpack_data(input_data)
     (max_happiness, happiest_arrangement) = find_happiest_arrangement(people, happiness_pairs)
     # expected max happiness for test input: 330
     # max happiness for real input: 618
     logging.info(f"Part One: {max_happiness} => {happiest_arrangement}")
+    return max_happiness
 
 
 # Forgot to seat myself. I'm worth 0 happiness regardless of who I sit next to.
-def part_two(input_data: list[str], args) -> None:
+def part_two(input_data: list[str], args) -> int:
     (people, happiness_pairs) = unpack_data(input_data)
     for person in people:
         pair = ''.join(sorted(['Me', person]))
@@ -85,6 +91,7 @@ def part_two(input_data: list[str], args) -> None:
     # max happiness for real input: 601
     # vs 618 without me :(
     logging.info(f"Part Two: {max_happiness} => {happiest_arrangement}")
+    return max_happiness
 
 
 if __name__ == '__main__':
@@ -93,11 +100,12 @@ if __name__ == '__main__':
     parser.add_argument('-o', '--output-file', default=None)
     parser.add_argument('-v', '--verbose', '--debug', default=False, action='store_true')
     parser.add_argument('-p', '--part', type=int, default=1)
+    parser.add_argument('--profile', default=False, action='store_true')
     args = parser.parse_args()
     configure_logging(args.verbose, args.output_file)
 
     filename = args.input_file
     with open(filename) as input_file:
         input_data = [line.rstrip('\n') for line in input_file]
-    if args.part == 1: part_one(input_data, args)
-    elif args.part == 2: part_two(input_data, args)
+    if args.part == 1: profiling.run(part_one, input_data, args)
+    elif args.part == 2: profiling.run(part_two, input_data, args)
@@ -1,5 +1,10 @@
 import logging
 import argparse
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from aoc import profiling
 
 def configure_logging(verbose, output_file):
     log_level = logging.DEBUG if verbose else logging.INFO
@@ -17,12 +22,13 @@ def configure_logging(verbose, output_file):
         )
 
 
-def part_one(input_data: list[str], args) -> None:
+def part_one(input_data: list[str], args) -> int:
     # I did this ON PAPER!
     logging.info(f"Part One: 2655")
+    return 2655
 
 
-def part_two(input_data: list[str], args) -> None:
+def part_two(input_data: list[str], args) -> int:
     # I formatted my own input data instead of saving the AoC file
     # Mostly because my internet is down so I got it from my phone
     reindeers = [] # is totally the correct plural form
@@ -58,6 +64,7 @@ def part_two(input_data: list[str], args) -> None:
     # real answer: Vixen wins with 1059 points, at distance=2640
     # Congrats, Vixen!
     logging.info(f"Part Two: {leader}")
+    return leader['points']
 
 
 if __name__ == '__main__':
@@ -66,6 +73,7 @@ if __name__ == '__main__':
     parser.add_argument('-o', '--output-file', default=None)
     parser.add_argument('-v', '--verbose', default=False, action='store_true')
     parser.add_argument('-p', '--part', type=int, default=1)
+    parser.add_argument('--profile', default=False, action='store_true')
     parser.add_argument('-t', '--race-time', type=int, default=2503)
     args = parser.parse_args()
     configure_logging(args.verbose, args.output_file)
@@ -73,5 +81,5 @@ if __name__ == '__main__':
     filename = args.input_file
     with open(filename) as input_file:
         input_data = [line.rstrip('\n') for line in input_file]
-    if args.part == 1: part_one(input_data, args)
-    elif args.part == 2: part_two(input_data, args)
+    if args.part == 1: profiling.run(part_one, input_data, args)
+    elif args.part == 2: profiling.run(part_two, input_data, args)
@@ -1,8 +1,13 @@
 import logging
 import argparse
 import re
+import os
+import sys
 from collections import deque, defaultdict
 
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from aoc import profiling
+
 def configure_logging(verbose, output_file):
     log_level = logging.DEBUG if verbose else logging.INFO
     if output_file is None:
@@ -23,7 +28,7 @@ stats = ['capacity', 'durability', 'flavour', 'texture', 'calories']
 def parse_ingredients(data):
     ingredients = {}
     line_pattern = re.compile(r'(\w+): capacity (-?\d+), durability (-?\d+), flavor (-?\d+), texture (-?\d+), calories (-?\d+)')
-    for line in input_data:
+    for line in data:
         m = line_pattern.match(line)
         name = m.group(1)
         capacity = int(m.group(2))
@@ -97,7 +102,7 @@ def find_best(ingredients, check_done_func, compare_best_func, wants_this_func):
             recipes.append(new_recipe)
     return (best_score, best_scoring_recipe)
 
-def part_one(input_data: list[str], args) -> None:
+def part_one(input_data: list[str], args) -> int:
     ingredients = parse_ingredients(input_data)
     (best_score, best_scoring_recipe) = find_best(ingredients, check_tsps, check_score, wants_this_ingredient)
     # test expected: 44 butterscotch + 56 cinnamon = score 62,842,880
@@ -107,15 +112,17 @@ def part_one(input_data: list[str], args) -> None:
         # A texture of 44*3 + 56*-1 = 76
     # actual: Part One: 62,842,880 = {'Butterscotch': 44, 'Cinnamon': 56, 'tsps_used': 100, 'capacity': 68, 'durability': 80, 'flavour': 152, 'texture': 76}
     logging.info(f"Part One: {best_score} = {best_scoring_recipe}")
+    return best_score
 
 
 # as above, but with exactly 500 calories
-def part_two(input_data: list[str], args) -> None:
+def part_two(input_data: list[str], args) -> int:
     ingredients = parse_ingredients(input_data)
     (best_score, best_scoring_recipe) = find_best(ingredients, check_tsps_and_calories, check_score_and_calories, wants_these_calories)
     # test expected: 40 butterscotch + 60 cinnamon = 40*8 + 60*3 = 500 calories, score = 57600000
     # actual: score 57600000 = 40 butterscotch + 60 cinnamon
     logging.info(f"Part Two: {best_score} = {best_scoring_recipe}")
+    return best_score
 
 
 if __name__ == '__main__':
@@ -124,11 +131,12 @@ if __name__ == '__main__':
     parser.add_argument('-o', '--output-file', default=None)
     parser.add_argument('-v', '--verbose', default=False, action='store_true')
     parser.add_argument('-p', '--part', type=int, default=1)
+    parser.add_argument('--profile', default=False, action='store_true')
     args = parser.parse_args()
     configure_logging(args.verbose, args.output_file)
 
     filename = args.input_file
     with open(filename) as input_file:
         input_data = [line.rstrip('\n') for line in input_file]
-    if args.part == 1: part_one(input_data, args)
-    elif args.part == 2: part_two(input_data, args)
+    if args.part == 1: profiling.run(part_one, input_data, args)
+    elif args.part == 2: profiling.run(part_two, input_data, args)
@@ -1,7 +1,12 @@
 import logging
 import argparse
+import os
+import sys
 from collections import deque
 
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from aoc import profiling
+
 def configure_logging(verbose, output_file):
     log_level = logging.DEBUG if verbose else logging.INFO
     if output_file is None:
@@ -47,7 +52,7 @@ class Filler:
         return f"T{self.target} C{self.capacity} (U{[c.key() for c in self.used_containers]}) A{[c.key() for c in self.available_containers]}"
 
 
-def part_one(input_data: list[str], args):
+def find_fillers(input_data: list[str], args) -> list[Filler]:
     containers = []
     for line_index,line in enumerate(input_data):
         containers.append(Container(line_index, int(line)))
@@ -78,21 +83,28 @@ def part_one(input_data: list[str], args):
                 filler.available_containers[:i] + filler.available_containers[i+1:]
             )
             filler_options.append(new_filler)
+    logging.debug(f"{[str(filler) for filler in fillers_filled]}")
+    return fillers_filled
+
+
+def part_one(input_data: list[str], args) -> int:
+    fillers_filled = find_fillers(input_data, args)
+    ways_found = len(fillers_filled)
     # test: 25 litres => 4 ways
     # actual: 150 litres => ? ways
     logging.info(f"Part One: {ways_found}")
-    logging.debug(f"{[str(filler) for filler in fillers_filled]}")
-    return fillers_filled
+    return ways_found
 
 
 # find the minimum number of containers to fit exactly 150L
 # and then find how many combinations use that many
-def part_two(input_data: list[str], args) -> None:
-    fillers_filled = part_one(input_data, args)
+def part_two(input_data: list[str], args) -> int:
+    fillers_filled = find_fillers(input_data, args)
     min_containers = min([len(filler.used_containers) for filler in fillers_filled])
     matching_containers = [filler for filler in fillers_filled if len(filler.used_containers) == min_containers]
     logging.info(f"Part Two: {len(matching_containers)} ways to use {min_containers} containers to get {args.target} litres")
     logging.debug(f"{[str(filler) for filler in matching_containers]}")
+    return len(matching_containers)
 
 
 if __name__ == '__main__':
@@ -101,6 +113,7 @@ if __name__ == '__main__':
     parser.add_argument('-o', '--output-file', default=None)
     parser.add_argument('-v', '--verbose', default=False, action='store_true')
     parser.add_argument('-p', '--part', type=int, default=1)
+    parser.add_argument('--profile', default=False, action='store_true')
     parser.add_argument('-t', '--target', type=int, default=150)
     args = parser.parse_args()
     configure_logging(args.verbose, args.output_file)
@@ -108,5 +121,5 @@ if __name__ == '__main__':
     filename = args.input_file
     with open(filename) as input_file:
         input_data = [line.rstrip('\n') for line in input_file]
-    if args.part == 1: part_one(input_data, args)
-    elif args.part == 2: part_two(input_data, args)
+    if args.part == 1: profiling.run(part_one, input_data, args)
+    elif args.part == 2: profiling.run(part_two, input_data, args)
@@ -1,7 +1,12 @@
 import logging
 import argparse
+import os
+import sys
 from itertools import product
 
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from aoc import profiling
+
 def configure_logging(verbose, output_file):
     log_level = logging.DEBUG if verbose else logging.INFO
     if output_file is None:
@@ -57,19 +62,21 @@ def print_lights(lights, max_r, max_c):
 # A light which is off turns on if exactly 3 neighbors are on, and stays off otherwise.
 # In your grid of 100x100 lights, given your initial configuration,
 # how many lights are on after 100 steps?
-def part_one(input_data: list[str], args) -> None:
+def part_one(input_data: list[str], args) -> int:
     lights = {}
     for line_index,line in enumerate(input_data):
         for char_index,char in enumerate(line):
             lights[(line_index, char_index)] = char
     for s in range(args.steps):
         lights = step(lights)
-    logging.info(f"Part One: {list(lights.values()).count(ON)}")
+    lit_count = list(lights.values()).count(ON)
+    logging.info(f"Part One: {lit_count}")
+    return lit_count
 
 
 # four lights, one in each corner, are stuck on and can't be turned off
 # now how many are on after 100 steps?
-def part_two(input_data: list[str], args) -> None:
+def part_two(input_data: list[str], args) -> int:
     lights = {}
     max_r = 0
     max_c = 0
@@ -84,7 +91,9 @@ def part_two(input_data: list[str], args) -> None:
         lights = step(lights)
         for c in corners: lights[c] = ON
         # print_lights(lights, max_r, max_c)
-    logging.info(f"Part Two: {list(lights.values()).count(ON)}")
+    lit_count = list(lights.values()).count(ON)
+    logging.info(f"Part Two: {lit_count}")
+    return lit_count
 
 
 if __name__ == '__main__':
@@ -93,6 +102,7 @@ if __name__ == '__main__':
     parser.add_argument('-o', '--output-file', default=None)
     parser.add_argument('-v', '--verbose', default=False, action='store_true')
     parser.add_argument('-p', '--part', type=int, default=1)
+    parser.add_argument('--profile', default=False, action='store_true')
     parser.add_argument('-s', '--steps', type=int, default=100)
     args = parser.parse_args()
     configure_logging(args.verbose, args.output_file)
@@ -100,5 +110,5 @@ if __name__ == '__main__':
     filename = args.input_file
     with open(filename) as input_file:
         input_data = [line.rstrip('\n') for line in input_file]
-    if args.part == 1: part_one(input_data, args)
-    elif args.part == 2: part_two(input_data, args)
+    if args.part == 1: profiling.run(part_one, input_data, args)
+    elif args.part == 2: profiling.run(part_two, input_data, args)
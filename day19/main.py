@@ -1,10 +1,15 @@
 import logging
 import argparse
 import re
+import os
+import sys
 from collections import defaultdict, deque
 from random import randint
 from queue import PriorityQueue
 
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from aoc import profiling, counters, checkpoint
+
 def configure_logging(verbose, output_file):
     log_level = logging.DEBUG if verbose else logging.INFO
     if output_file is None:
@@ -45,7 +50,7 @@ def parse_input(data):
         replacements[splits[0]].append(splits[1])
     return (original_molecule, replacements)
 
-def part_one(input_data: list[str], args) -> None:
+def part_one(input_data: list[str], args) -> int:
     (original_molecule, replacements) = parse_input(input_data)
     replacement_molecules = set()
     element = ''
@@ -61,6 +66,7 @@ def part_one(input_data: list[str], args) -> None:
             replacement_molecules.add(head + r + tail)
         element = ''
     logging.info(f"Part One: {len(replacement_molecules)}")
+    return len(replacement_molecules)
 
 def dead_end(molecule_tracker, fastest_seen):
     molecule = molecule_tracker.molecule
@@ -76,15 +82,29 @@ def dead_end(molecule_tracker, fastest_seen):
         return True
     return False
 
-def part_two(input_data: list[str], args) -> None:
+def part_two(input_data: list[str], args) -> int:
     (target_molecule, replacements) = parse_input(input_data)
     backwards = { v:k for k,vs in replacements.items() for v in vs}
     paths = PriorityQueue()
-    paths.put((len(target_molecule), MoleculeTracker(target_molecule, 0)))
-    fastest_seen = {}
+    path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'part2.checkpoint.json')
+    progress = checkpoint.from_args(args, path, [target_molecule, backwards])
+    saved = progress.load()
+    if saved is None:
+        paths.put((len(target_molecule), MoleculeTracker(target_molecule, 0)))
+        fastest_seen = {}
+    else:
+        for (molecule, steps) in saved['paths']:
+            paths.put((len(molecule), MoleculeTracker(molecule, steps)))
+        fastest_seen = saved['fastest_seen']
     while not paths.empty():
+        if progress.due():
+            queued = [[tracker.molecule, tracker.steps] for (_, tracker) in paths.queue]
+            progress.save({ 'paths': queued, 'fastest_seen': fastest_seen })
         molecule_tracker = paths.get()[1]
-        if dead_end(molecule_tracker, fastest_seen): continue
+        if dead_end(molecule_tracker, fastest_seen):
+            counters.add('dead ends skipped')
+            continue
+        counters.add('states expanded')
         molecule = molecule_tracker.molecule
         steps = molecule_tracker.steps
         if args.logging_frequency > 0 and randint(1, args.logging_frequency) == args.logging_frequency:
@@ -99,7 +119,9 @@ def part_two(input_data: list[str], args) -> None:
                 [m.start() for m in re.finditer(f"(?={element})", molecule)]]
             for new_molecule in new_molecules:
                 paths.put((len(new_molecule), MoleculeTracker(new_molecule, steps+1)))
+    progress.clear()
     logging.info(f"Part Two: {fastest_seen.get('e', 0)}")
+    return fastest_seen.get('e', 0)
 
 if __name__ == '__main__':
     parser = argparse.ArgumentParser()
@@ -107,12 +129,17 @@ if __name__ == '__main__':
     parser.add_argument('-o', '--output-file', default=None)
     parser.add_argument('-v', '--verbose', default=False, action='store_true')
     parser.add_argument('-p', '--part', type=int, default=1)
+    parser.add_argument('--profile', default=False, action='store_true')
     parser.add_argument('-l', '--logging-frequency', type=int, default=1000)
+    parser.add_argument('--checkpoint-file', default=None)
+    parser.add_argument('--checkpoint-interval', type=float, default=checkpoint.DEFAULT_INTERVAL)
+    parser.add_argument('--resume', default=False, action='store_true')
     args = parser.parse_args()
     configure_logging(args.verbose, args.output_file)
 
     filename = args.input_file
     with open(filename) as input_file:
         input_data = [line.rstrip('\n') for line in input_file]
-    if args.part == 1: part_one(input_data, args)
-    elif args.part == 2: part_two(input_data, args)
+    if args.part == 1: profiling.run(part_one, input_data, args)
+    elif args.part == 2: profiling.run(part_two, input_data, args)
+    counters.report()
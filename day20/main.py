@@ -1,7 +1,12 @@
 import logging
 import argparse
+import os
+import sys
 from collections import defaultdict
 
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from aoc import profiling, checkpoint
+
 
 def configure_logging(verbose, output_file):
     log_level = logging.DEBUG if verbose else logging.INFO
@@ -28,33 +33,52 @@ def find_factors(number):
     return factors
 
 
+# houses between looking at the clock
+CHECKPOINT_CHECK = 1000
+
+def open_checkpoint(target_gifts: int, part: int, args) -> checkpoint.Checkpoint:
+    path = os.path.join(os.path.dirname(os.path.abspath(__file__)), f"part{part}.checkpoint.json")
+    return checkpoint.from_args(args, path, target_gifts)
+
+
 # There are infinitely many Elves, numbered starting with 1.
 # Each Elf delivers presents to a house if the house's number is divisible by the Elf's number.
 # Each Elf delivers presents equal to ten times his or her number at each house.
 # What is the lowest house number to get at least as many presents as the number in your puzzle input?
-def part_one(target_gifts: int, args) -> None:
+def part_one(target_gifts: int, args) -> int:
+    progress = open_checkpoint(target_gifts, 1, args)
     target_gifts = int(target_gifts / 10)
     gifts = 0
-    house_number = 0
+    saved = progress.load()
+    house_number = 0 if saved is None else saved['house_number']
     while gifts < target_gifts:
         house_number += 1
         elf_visitors = find_factors(house_number)
         gifts = sum(elf_visitors)
         if args.logging_interval > 0 and house_number % args.logging_interval == 0:
             logging.debug(f"H{house_number}: G{gifts*10}")
+        if house_number % CHECKPOINT_CHECK == 0 and progress.due():
+            progress.save({ 'house_number': house_number })
+    progress.clear()
 
     logging.info(f"Part One: T {target_gifts*10} => H {house_number}")
+    return house_number
 
 
 # each Elf will stop after delivering presents to 50 houses
 # but will deliver presents equal to eleven times their number at each house
 # What is the new lowest house number to get at least as many presents as the number in your puzzle input?
-def part_two(target_gifts: int, args) -> None:
+def part_two(target_gifts: int, args) -> int:
     max_deliveries_per_elf = 50
     gifts_per_elf_number = 11
+    progress = open_checkpoint(target_gifts, 2, args)
     gifts_delivered = defaultdict(int)
     gifts = 0
     house_number = 0
+    saved = progress.load()
+    if saved is not None:
+        house_number = saved['house_number']
+        gifts_delivered.update(enumerate(saved['gifts_delivered'], start=1))
     while gifts < target_gifts:
         gifts = 0
         house_number += 1
@@ -65,7 +89,13 @@ def part_two(target_gifts: int, args) -> None:
                 gifts += e * gifts_per_elf_number
         if args.logging_interval > 0 and house_number % args.logging_interval == 0:
             logging.debug(f"H{house_number}: G{gifts}")
+        if house_number % CHECKPOINT_CHECK == 0 and progress.due():
+            # every elf up to the current house has started, so a plain list indexed by elf covers them all
+            deliveries = [gifts_delivered[e] for e in range(1, house_number + 1)]
+            progress.save({ 'house_number': house_number, 'gifts_delivered': deliveries })
+    progress.clear()
     logging.info(f"Part Two: T {target_gifts} => H {house_number}")
+    return house_number
 
 
 if __name__ == '__main__':
@@ -74,8 +104,12 @@ if __name__ == '__main__':
     parser.add_argument('-o', '--output-file', default=None)
     parser.add_argument('-v', '--verbose', default=False, action='store_true')
     parser.add_argument('-p', '--part', type=int, default=1)
+    parser.add_argument('--profile', default=False, action='store_true')
     parser.add_argument('-l', '--logging-interval', type=int, default=0)
     parser.add_argument('-t', '--target-gifts', type=int, default=None)
+    parser.add_argument('--checkpoint-file', default=None)
+    parser.add_argument('--checkpoint-interval', type=float, default=checkpoint.DEFAULT_INTERVAL)
+    parser.add_argument('--resume', default=False, action='store_true')
     args = parser.parse_args()
     configure_logging(args.verbose, args.output_file)
 
@@ -83,5 +117,5 @@ if __name__ == '__main__':
     with open(filename) as input_file:
         input_data = [int(line.rstrip('\n')) for line in input_file]
     target_gifts = input_data[0] if args.target_gifts is None else args.target_gifts
-    if args.part == 1: part_one(target_gifts, args)
-    elif args.part == 2: part_two(target_gifts, args)
+    if args.part == 1: profiling.run(part_one, target_gifts, args)
+    elif args.part == 2: profiling.run(part_two, target_gifts, args)
@@ -1,9 +1,14 @@
 import logging
 import argparse
 import copy
+import os
+import sys
 from queue import PriorityQueue
 from collections import defaultdict
 
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from aoc import profiling, counters
+
 def configure_logging(verbose, output_file):
     log_level = logging.DEBUG if verbose else logging.INFO
     if output_file is None:
@@ -161,8 +166,11 @@ def run_fights(fights):
     while not fights.empty():
         fight = fights.get()[1]
         fight_key = fight.get_key()
-        if fight_key in scenarios: continue
+        if fight_key in scenarios:
+            counters.add('duplicates skipped')
+            continue
         scenarios.add(fight_key)
+        counters.add('states expanded')
         player = fight.player
         boss = fight.boss
         mana_spent = fight.mana_spent
@@ -189,7 +197,7 @@ def run_fights(fights):
 
 
 # What is the least amount of mana you can spend and still win the fight?
-def part_one(args) -> None:
+def part_one(args) -> int:
     fights = PriorityQueue()
     for spell_name in SPELLS:
         fight = Fight(
@@ -199,11 +207,12 @@ def part_one(args) -> None:
         fights.put((0, fight))
     (least_mana_spent, winning_spell_combo) = run_fights(fights)
     logging.info(f"Part One: {least_mana_spent} (expected 953) using spells: {winning_spell_combo}")
+    return least_mana_spent
 
 
 # At the start of each player turn (before any other effects apply), you lose 1 hit point.
 # Now what's the least amount of mana you can spend and still win the fight?
-def part_two(args) -> None:
+def part_two(args) -> int:
     fights = PriorityQueue()
     for spell_name in SPELLS:
         fight = Fight(
@@ -213,6 +222,7 @@ def part_two(args) -> None:
         fights.put((0, fight))
     (least_mana_spent, winning_spell_combo) = run_fights(fights)
     logging.info(f"Part Two: {least_mana_spent} (expected 1289) using spells: {winning_spell_combo}")
+    return least_mana_spent
 
 
 if __name__ == '__main__':
@@ -220,8 +230,10 @@ if __name__ == '__main__':
     parser.add_argument('-o', '--output-file', default=None)
     parser.add_argument('-v', '--verbose', default=False, action='store_true')
     parser.add_argument('-p', '--part', type=int, default=1)
+    parser.add_argument('--profile', default=False, action='store_true')
     args = parser.parse_args()
     configure_logging(args.verbose, args.output_file)
 
-    if args.part == 1: part_one(args)
-    elif args.part == 2: part_two(args)
+    if args.part == 1: profiling.run(part_one, args)
+    elif args.part == 2: profiling.run(part_two, args)
+    counters.report()
@@ -1,8 +1,13 @@
 import logging
 import argparse
+import os
 import re
+import sys
 from collections import defaultdict
 
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from aoc import tracing, profiling, counters
+
 def configure_logging(verbose, output_file):
     log_level = logging.DEBUG if verbose else logging.INFO
     if output_file is None:
@@ -26,37 +31,38 @@ jie_pattern = re.compile(r'jie (\w), ([+-]\d+)')
 jio_pattern = re.compile(r'jio (\w), ([+-]\d+)')
 
 def apply_hlf(instruction, register_values):
-    logging.debug(f"HLF {instruction}")
+    if tracing.enabled: tracing.event("HLF %s", instruction)
     m = hlf_pattern.match(instruction)
     register = m.group(1)
-    register_values[register] /= 2
+    # registers are whole numbers, and / would turn them into floats that lose precision past 2^53
+    register_values[register] //= 2
 
 def apply_tpl(instruction, register_values):
-    logging.debug(f"TPL {instruction}")
+    if tracing.enabled: tracing.event("TPL %s", instruction)
     m = tpl_pattern.match(instruction)
     register = m.group(1)
     register_values[register] *= 3
 
 def apply_inc(instruction, register_values):
-    logging.debug(f"INC {instruction}")
+    if tracing.enabled: tracing.event("INC %s", instruction)
     m = inc_pattern.match(instruction)
     register = m.group(1)
     register_values[register] += 1
 
 def apply_jmp(instruction):
-    logging.debug(f"JMP {instruction}")
+    if tracing.enabled: tracing.event("JMP %s", instruction)
     m = jmp_pattern.match(instruction)
     return int(m.group(1))
 
 def apply_jie(instruction, register_values):
-    logging.debug(f"JIE {instruction}")
+    if tracing.enabled: tracing.event("JIE %s", instruction)
     m = jie_pattern.match(instruction)
     register = m.group(1)
     if register_values[register] % 2 == 0: return int(m.group(2))
     return 1
 
 def apply_jio(instruction, register_values):
-    logging.debug(f"JIO {instruction}")
+    if tracing.enabled: tracing.event("JIO %s", instruction)
     m = jio_pattern.match(instruction)
     register = m.group(1)
     if register_values[register] == 1: return int(m.group(2))
@@ -65,8 +71,10 @@ def apply_jio(instruction, register_values):
 
 def run(instructions, register_values, register_wanted):
     index = 0
+    executed = 0
     while index < len(instructions):
         instruction = instructions[index]
+        executed += 1
         if instruction.startswith('hlf'):
             apply_hlf(instruction, register_values)
             index += 1
@@ -82,24 +90,27 @@ def run(instructions, register_values, register_wanted):
             index += apply_jie(instruction, register_values)
         elif instruction.startswith('jio'):
             index += apply_jio(instruction, register_values)
-        logging.debug(register_values)
+        if tracing.enabled: tracing.event("%s", dict(register_values))
+    counters.add('instructions executed', executed)
     return register_values[register_wanted]
 
 
 # What is the value in register b when the program in your puzzle input is finished executing?
 # The program exits when it tries to run an instruction beyond the ones defined.
-def part_one(instructions: list[str], args) -> None:
+def part_one(instructions: list[str], args) -> int:
     register_values = defaultdict(int)
     value = run(instructions, register_values, 'b')
     logging.info(f"Part One: {value}")
+    return value
 
 
 # what is the value in register b after the program is finished executing if register a starts as 1 instead?
-def part_two(instructions: list[str], args) -> None:
+def part_two(instructions: list[str], args) -> int:
     register_values = defaultdict(int)
     register_values['a'] = 1
     value = run(instructions, register_values, 'b')
     logging.info(f"Part Two: {value}")
+    return value
 
 
 # `hlf r` sets register r to half its current value, then continues with the next instruction.
@@ -115,11 +126,14 @@ if __name__ == '__main__':
     parser.add_argument('-o', '--output-file', default=None)
     parser.add_argument('-v', '--verbose', default=False, action='store_true')
     parser.add_argument('-p', '--part', type=int, default=1)
+    parser.add_argument('--profile', default=False, action='store_true')
     args = parser.parse_args()
     configure_logging(args.verbose, args.output_file)
+    if args.verbose: tracing.enable()
 
     filename = args.input_file
     with open(filename) as input_file:
         input_data = [line.rstrip('\n') for line in input_file]
-    if args.part == 1: part_one(input_data, args)
-    elif args.part == 2: part_two(input_data, args)
+    if args.part == 1: profiling.run(part_one, input_data, args)
+    elif args.part == 2: profiling.run(part_two, input_data, args)
+    counters.report()
@@ -2,6 +2,11 @@ import logging
 import argparse
 import itertools
 import math
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from aoc import profiling
 
 
 def configure_logging(verbose, output_file):
@@ -31,16 +36,18 @@ def find_min_entanglement(package_weights, target_weight):
     return sorted(math.prod(g) for g in valid_groups)[0]
 
 
-def part_one(package_weights, args) -> None:
+def part_one(package_weights, args) -> int:
     target_weight = int(sum(package_weights) / 3)
     min_entanglement = find_min_entanglement(package_weights, target_weight)
     logging.info(f"Part One: {min_entanglement}")
+    return min_entanglement
 
 
-def part_two(package_weights, args) -> None:
+def part_two(package_weights, args) -> int:
     target_weight = int(sum(package_weights) / 4)
     min_entanglement = find_min_entanglement(package_weights, target_weight)
     logging.info(f"Part Two: {min_entanglement}")
+    return min_entanglement
 
 
 if __name__ == '__main__':
@@ -49,11 +56,12 @@ if __name__ == '__main__':
     parser.add_argument('-o', '--output-file', default=None)
     parser.add_argument('-v', '--verbose', default=False, action='store_true')
     parser.add_argument('-p', '--part', type=int, default=1)
+    parser.add_argument('--profile', default=False, action='store_true')
     args = parser.parse_args()
     configure_logging(args.verbose, args.output_file)
 
     filename = args.input_file
     with open(filename) as input_file:
         input_data = [int(line.rstrip('\n')) for line in input_file]
-    if args.part == 1: part_one(input_data, args)
-    elif args.part == 2: part_two(input_data, args)
+    if args.part == 1: profiling.run(part_one, input_data, args)
+    elif args.part == 2: profiling.run(part_two, input_data, args)
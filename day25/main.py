@@ -1,5 +1,10 @@
 import logging
 import argparse
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from aoc import profiling
 
 
 def configure_logging(verbose, output_file):
@@ -18,7 +23,7 @@ def configure_logging(verbose, output_file):
         )
 
 
-def part_one(args) -> None:
+def part_one(args) -> int:
     # target_r = 2978
     # target_c = 3083
     target_r = 2978
@@ -47,13 +52,15 @@ def part_one(args) -> None:
             break
 
     logging.info(f"Part One: {n}")
+    return n
 
 
 if __name__ == '__main__':
     parser = argparse.ArgumentParser()
     parser.add_argument('-o', '--output-file', default=None)
     parser.add_argument('-v', '--verbose', default=False, action='store_true')
+    parser.add_argument('--profile', default=False, action='store_true')
     args = parser.parse_args()
     configure_logging(args.verbose, args.output_file)
 
-    part_one(args)
+    profiling.run(part_one, args)